@@ -1,16 +1,25 @@
 """Pandera Report for row-based reporting by using the power of pandera."""
 
+from pandera_report.cache import ValidationCache
+from pandera_report.engine import NativeCheckEngine
 from pandera_report.options import QualityColumnsOptions, QualityStatusOptions
 from pandera_report.parser import DefaultFailureCaseParser, FailureCaseParser
+from pandera_report.report import QualityReport
 from pandera_report.validator import DataFrameValidator
 from pandera_report.version import __version__
 
 __all__ = [
     # validator
     "DataFrameValidator",
+    # report
+    "QualityReport",
     # parser
     "DefaultFailureCaseParser",
     "FailureCaseParser",
+    # cache
+    "ValidationCache",
+    # engine
+    "NativeCheckEngine",
     # options
     "QualityStatusOptions",
     "QualityColumnsOptions",
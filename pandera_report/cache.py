@@ -0,0 +1,447 @@
+import hashlib
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from types import CodeType
+from typing import (
+    Any,
+    Optional,
+    TypedDict,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024**2
+
+SCHEMA_ATTRIBUTES = (
+    "dtype",
+    "coerce",
+    "strict",
+    "ordered",
+    "unique",
+    "report_duplicates",
+    "unique_column_names",
+    "add_missing_columns",
+    "drop_invalid_rows",
+)
+COMPONENT_ATTRIBUTES = ("dtype", "nullable", "unique", "coerce", "required", "regex", "default")
+CHECK_ATTRIBUTES = (
+    "name",
+    "error",
+    "statistics",
+    "element_wise",
+    "ignore_na",
+    "groupby",
+    "n_failure_cases",
+    "raise_warning",
+)
+
+
+class CacheEntry(TypedDict):
+    """
+    TypedDict representing a cached validation result.
+
+    Attributes:
+        is_valid (bool): Whether the DataFrame was valid.
+        references (np.ndarray): The row position of each failure case.
+        codes (np.ndarray): The position of each failure case's label in `labels`.
+        labels (pd.DataFrame): The distinct failure labels with a "column" and a "check" column.
+        issues (Optional[np.ndarray]): The values of the quality issues column, if already formatted.
+        status (Optional[np.ndarray]): The values of the quality status column, if already computed.
+    """
+
+    is_valid: bool
+    references: np.ndarray
+    codes: np.ndarray
+    labels: pd.DataFrame
+    issues: Optional[np.ndarray]
+    status: Optional[np.ndarray]
+
+
+class CacheStatistics(TypedDict):
+    """
+    TypedDict representing the statistics of a validation cache.
+
+    Attributes:
+        hits (int): The number of lookups answered from memory or disk.
+        misses (int): The number of lookups without a stored result.
+        disk_hits (int): The number of hits answered from the disk tier.
+        evictions (int): The number of entries evicted from memory.
+        entries (int): The number of entries held in memory.
+        size (int): The approximate size of the entries held in memory in bytes.
+    """
+
+    hits: int
+    misses: int
+    disk_hits: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class ValidationCache:
+    """
+    A cache for validation results keyed by a schema fingerprint and a DataFrame hash.
+
+    Results are held in an in-memory LRU which evicts the least recently used entries once the
+    stored failure cases and quality columns exceed `max_bytes`. If a directory is given, results are also
+    stored on disk and looked up there on a memory miss. Entries which cannot be written or read,
+    e.g. pickles of another pandas version, are skipped.
+
+    Parameters:
+        max_bytes (int, optional): The maximum size of the in-memory tier in bytes. Defaults to 256 MiB.
+        directory (Optional[Union[str, Path]], optional): The directory of the disk tier.
+            If not provided, results are only held in memory.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES, directory: Optional[Union[str, Path]] = None):
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory else None
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._entries: OrderedDict[str, tuple[CacheEntry, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStatistics:
+        """
+        Get the hit and miss statistics of the cache.
+
+        Returns:
+            CacheStatistics: The statistics of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "disk_hits": self._disk_hits,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "size": self._size,
+            }
+
+    def make_key(self, schema: pa.DataFrameSchema, df: pd.DataFrame, *parts: Any) -> Optional[str]:
+        """
+        Create a cache key for validating a DataFrame against a schema.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema used for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+            *parts (Any): Further values the validation result depends on, e.g. validator options.
+
+        Returns:
+            Optional[str]: The cache key or None, if the result cannot be cached because the schema
+                transforms the data or the DataFrame cannot be hashed.
+        """
+        if schema_transforms_data(schema):
+            return None
+
+        frame_hash = frame_fingerprint(df)
+        if frame_hash is None:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(schema_fingerprint(schema).encode())
+        digest.update(frame_hash.encode())
+        digest.update(repr(_canonical(parts)).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a validation result.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The stored result or None, if there is none.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key][0]
+
+        entry = self._read(key)
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._disk_hits += 1
+            self._store(key, entry)
+            return entry
+
+    def put(self, key: str, entry: CacheEntry):
+        """
+        Store a validation result.
+
+        Args:
+            key (str): The cache key.
+            entry (CacheEntry): The validation result.
+        """
+        with self._lock:
+            self._store(key, entry)
+
+        self._write(key, entry)
+
+    def clear(self):
+        """
+        Remove all entries from memory and disk and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = self._hits = self._misses = self._disk_hits = self._evictions = 0
+
+        if self.directory:
+            for path in self.directory.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+    def _store(self, key: str, entry: CacheEntry):
+        if key in self._entries:
+            self._size -= self._entries.pop(key)[1]
+
+        size = entry_size(entry)
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (entry, size)
+        self._size += size
+
+        while self._size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            self._evictions += 1
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        if not self.directory:
+            return None
+
+        try:
+            with open(self.directory / f"{key}.pkl", "rb") as file:
+                return pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def _write(self, key: str, entry: CacheEntry):
+        if not self.directory:
+            return
+
+        tmp_path: Optional[Path] = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as file:
+                tmp_path = Path(file.name)
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(self.directory / f"{key}.pkl")
+        except OSError:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+
+def entry_size(entry: CacheEntry) -> int:
+    """
+    Approximate the memory size of a cached validation result.
+
+    Args:
+        entry (CacheEntry): The validation result.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    size = int(entry["labels"].memory_usage(index=False, deep=True).sum())
+    for name in ("references", "codes", "issues", "status"):
+        if entry[name] is not None:
+            size += int(pd.Series(entry[name]).memory_usage(index=False, deep=True))
+    return size
+
+
+def schema_transforms_data(schema: pa.DataFrameSchema) -> bool:
+    """
+    Check whether validating against a schema may return data different from its input.
+
+    Args:
+        schema (pa.DataFrameSchema): The Pandera schema.
+
+    Returns:
+        bool: True, if the schema, a column or an index coerces, parses, adds, fills, filters or drops data.
+    """
+    if (
+        schema.coerce
+        or schema.parsers
+        or schema.add_missing_columns
+        or schema.drop_invalid_rows
+        or schema.strict == "filter"
+    ):
+        return True
+
+    if any(
+        column.coerce or column.parsers or column.default is not None or column.drop_invalid_rows
+        for column in schema.columns.values()
+    ):
+        return True
+
+    if schema.index is None:
+        return False
+
+    indexes = [schema.index, *getattr(schema.index, "indexes", [])]
+    return any(index.coerce or getattr(index, "parsers", None) for index in indexes)
+
+
+def schema_fingerprint(schema: pa.DataFrameSchema) -> str:
+    """
+    Create a fingerprint of a schema which is stable across processes.
+
+    Args:
+        schema (pa.DataFrameSchema): The Pandera schema.
+
+    Returns:
+        str: The hex digest of the schema.
+    """
+    parts: list[Any] = [_canonical({name: getattr(schema, name, None) for name in SCHEMA_ATTRIBUTES})]
+    parts.extend(_check_fingerprint(check) for check in schema.checks)
+
+    components = [(name, column) for name, column in schema.columns.items()]
+    if schema.index is not None:
+        components.extend((None, index) for index in getattr(schema.index, "indexes", [schema.index]))
+
+    for name, component in components:
+        parts.append(_canonical((name, {attr: getattr(component, attr, None) for attr in COMPONENT_ATTRIBUTES})))
+        parts.extend(_check_fingerprint(check) for check in component.checks)
+
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> Optional[str]:
+    """
+    Create a fast hash of a DataFrame's column labels, dtypes, index names and values.
+
+    Column labels are hashed with their types and categorical dtypes with their categories and order.
+
+    Values of object columns are hashed by their string form, so the inferred type of their values
+    is hashed as well. Object columns or indexes with values of mixed types are not hashed.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to hash.
+
+    Returns:
+        Optional[str]: The hex digest of the DataFrame or None, if its values cannot be hashed.
+    """
+    value_types = [
+        pd.api.types.infer_dtype(df.iloc[:, position], skipna=True) if dtype == object else None
+        for position, dtype in enumerate(df.dtypes)
+    ]
+    if df.index.dtype == object:
+        value_types.append(pd.api.types.infer_dtype(df.index, skipna=True))
+    if any(value_type is not None and value_type.startswith("mixed") for value_type in value_types):
+        return None
+
+    try:
+        values = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+
+    index_dtypes = list(df.index.dtypes) if isinstance(df.index, pd.MultiIndex) else [df.index.dtype]
+    labels = (
+        df.columns.tolist(),
+        df.columns.names,
+        str(df.columns.dtype),
+        [_dtype_fingerprint(dtype) for dtype in df.dtypes],
+        df.index.names,
+        [_dtype_fingerprint(dtype) for dtype in index_dtypes],
+    )
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(labels).encode())
+    digest.update(repr(value_types).encode())
+    digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def _dtype_fingerprint(dtype: Any) -> Any:
+    if isinstance(dtype, pd.CategoricalDtype):
+        return (str(dtype), dtype.categories.tolist(), str(dtype.categories.dtype), dtype.ordered)
+    return repr(dtype)
+
+
+def _check_fingerprint(check: pa.Check) -> str:
+    attributes = {name: getattr(check, name, None) for name in CHECK_ATTRIBUTES}
+    return repr((_canonical(attributes), _canonical(check._check_fn)))
+
+
+def _function_fingerprint(func: Any, seen: set[int]) -> Any:
+    if isinstance(func, partial):
+        return (_canonical(func.func, seen), _canonical(func.args, seen), _canonical(func.keywords, seen))
+
+    func = getattr(func, "__func__", func)
+    closure = []
+    for cell in getattr(func, "__closure__", None) or ():
+        try:
+            closure.append(_canonical(cell.cell_contents, seen))
+        except ValueError:
+            closure.append(None)
+
+    func_globals = getattr(func, "__globals__", {})
+    global_values = [
+        (name, _canonical(func_globals[name], seen))
+        for name in sorted(_code_names(func.__code__))
+        if name in func_globals
+    ]
+
+    return (
+        getattr(func, "__module__", None),
+        getattr(func, "__qualname__", None),
+        _code_fingerprint(func.__code__),
+        closure,
+        global_values,
+    )
+
+
+def _code_names(code: CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _code_fingerprint(code: CodeType) -> Any:
+    consts = [_code_fingerprint(const) if isinstance(const, CodeType) else repr(const) for const in code.co_consts]
+    return (code.co_code.hex(), consts, code.co_names)
+
+
+def _canonical(value: Any, seen: Optional[set[int]] = None) -> Any:
+    seen = set() if seen is None else seen
+
+    if isinstance(value, dict):
+        return sorted((repr(key), _canonical(item, seen)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(_canonical(item, seen)) for item in value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item, seen) for item in value]
+    if isinstance(value, type) or not (callable(value) or hasattr(value, "__dict__")):
+        return repr(value)
+
+    if id(value) in seen:
+        return None
+    seen.add(id(value))
+
+    if isinstance(value, partial) or hasattr(getattr(value, "__func__", value), "__code__"):
+        return _function_fingerprint(value, seen)
+    if type(value).__repr__ is object.__repr__:
+        return (type(value).__qualname__, _canonical(getattr(value, "__dict__", {}), seen))
+    return repr(value)
@@ -0,0 +1,552 @@
+"""Command-line entry point for validating many files in parallel."""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Iterator,
+    Optional,
+    Sequence,
+    TypedDict,
+)
+
+import pandas as pd
+import pandera as pa
+
+from pandera_report.engine import NativeCheckEngine
+from pandera_report.options import (
+    DEFAULT_QUALITY_ISSUES_COLUMN,
+    DEFAULT_QUALITY_STATUS_COLUMN,
+    QUALITY_STATUS_OPTIONS,
+    QualityColumnsOptions,
+)
+from pandera_report.validator import DataFrameValidator
+
+CSV_SUFFIXES = (".csv",)
+PARQUET_SUFFIXES = (".parquet", ".pq")
+YAML_SUFFIXES = (".yaml", ".yml")
+
+
+class FileSummary(TypedDict):
+    """
+    TypedDict representing the validation summary of a single input file.
+
+    Attributes:
+        input (str): The path of the validated file.
+        output (Optional[str]): The path of the enriched output file.
+        rows (int): The number of validated rows.
+        invalid_rows (int): The number of rows with quality issues.
+        chunks (int): The number of chunks the file was validated in.
+        is_valid (bool): Whether all rows of the file are valid.
+        seconds (float): The wall time spent on the file.
+        error (Optional[str]): The error message, if the file could not be processed.
+    """
+
+    input: str
+    output: Optional[str]
+    rows: int
+    invalid_rows: int
+    chunks: int
+    is_valid: bool
+    seconds: float
+    error: Optional[str]
+
+
+class RunSummary(TypedDict):
+    """
+    TypedDict representing the summary of a command-line run.
+
+    Attributes:
+        schema (str): The schema the files were validated against.
+        workers (int): The number of worker processes.
+        files (list[FileSummary]): The summaries of the single files.
+        rows (int): The total number of validated rows.
+        invalid_rows (int): The total number of rows with quality issues.
+        seconds (float): The wall time of the whole run.
+    """
+
+    schema: str
+    workers: int
+    files: list[FileSummary]
+    rows: int
+    invalid_rows: int
+    seconds: float
+
+
+def load_schema(spec: str) -> pa.DataFrameSchema:
+    """
+    Load a Pandera schema from a YAML file or a Python import path.
+
+    Args:
+        spec (str): Either the path to a pandera YAML schema or an import path to a DataFrameModel
+            or DataFrameSchema, written as ``package.module:Name`` or ``package.module.Name``.
+
+    Returns:
+        pa.DataFrameSchema: The loaded schema.
+    """
+    if spec.lower().endswith(YAML_SUFFIXES):
+        return pa.DataFrameSchema.from_yaml(Path(spec))
+
+    module_name, sep, name = spec.partition(":")
+    if not sep:
+        module_name, _, name = spec.rpartition(".")
+
+    if not module_name or not name:
+        raise ValueError(f"Invalid schema import path: {spec!r}")
+
+    schema = getattr(importlib.import_module(module_name), name)
+    if isinstance(schema, pa.DataFrameSchema):
+        return schema
+    return schema.to_schema()
+
+
+def expand_paths(patterns: Sequence[str]) -> list[Path]:
+    """
+    Expand glob patterns into a sorted list of unique file paths.
+
+    Args:
+        patterns (Sequence[str]): The glob patterns to expand.
+
+    Returns:
+        list[Path]: The matching file paths.
+    """
+    paths = {Path(path) for pattern in patterns for path in glob.glob(pattern, recursive=True)}
+    return sorted(path for path in paths if path.is_file())
+
+
+def output_paths(paths: Sequence[Path], output_dir: Optional[Path] = None) -> list[Optional[Path]]:
+    """
+    Map input files to output files, keeping their paths relative to the common parent directory of all inputs.
+
+    Args:
+        paths (Sequence[Path]): The input files.
+        output_dir (Optional[Path]): Optional. The directory to write the enriched files to.
+
+    Returns:
+        list[Optional[Path]]: The output file of each input file or None, if no output directory is given.
+    """
+    if not output_dir or not paths:
+        return [None] * len(paths)
+
+    resolved = [path.resolve() for path in paths]
+    root = Path(os.path.commonpath([path.parent for path in resolved]))
+    return [output_dir / path.relative_to(root) for path in resolved]
+
+
+def read_chunks(path: Path, chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or Parquet file, optionally in chunks of a given number of rows.
+
+    The dtypes of the chunks are decided once for the whole file, so that every chunk has the dtypes
+    the file would have if it was read at once, e.g. an integer column with nulls in any chunk is float.
+
+    Args:
+        path (Path): The file to read.
+        chunksize (Optional[int]): Optional. The number of rows per chunk. If not provided, the file is read at once.
+
+    Returns:
+        Iterator[pd.DataFrame]: The chunks of the file, each with a fresh RangeIndex.
+    """
+    suffix = path.suffix.lower()
+
+    if suffix in CSV_SUFFIXES:
+        if chunksize:
+            dtypes = csv_dtypes(path, chunksize)
+            with pd.read_csv(path, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield cast_chunk(chunk.reset_index(drop=True), dtypes)
+        else:
+            yield pd.read_csv(path)
+
+    elif suffix in PARQUET_SUFFIXES:
+        if chunksize:
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(path)
+            dtypes = parquet_dtypes(parquet_file)
+            for batch in parquet_file.iter_batches(batch_size=chunksize):
+                yield cast_chunk(batch.to_pandas(), dtypes)
+        else:
+            yield pd.read_parquet(path)
+
+    else:
+        raise ValueError(f"Unsupported file type: {path.suffix!r}")
+
+
+def csv_dtypes(path: Path, chunksize: int) -> dict[Any, Any]:
+    """
+    Infer the dtypes of a CSV file chunk by chunk, combining the dtypes of all chunks like a concatenation.
+
+    Args:
+        path (Path): The file to read.
+        chunksize (int): The number of rows per chunk.
+
+    Returns:
+        dict[Any, Any]: The dtype of each column.
+    """
+    df_empty: Optional[pd.DataFrame] = None
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            chunk_empty = chunk.iloc[:0]
+            df_empty = chunk_empty if df_empty is None else pd.concat([df_empty, chunk_empty])
+    return dict(df_empty.dtypes.items()) if df_empty is not None else {}
+
+
+def parquet_dtypes(parquet_file: Any) -> dict[Any, Any]:
+    """
+    Derive the dtypes of a Parquet file from its arrow schema and the null counts of its columns.
+
+    Dictionary encoded columns are left out, their categories are only known per batch.
+
+    Args:
+        parquet_file (pyarrow.parquet.ParquetFile): The file to read.
+
+    Returns:
+        dict[Any, Any]: The dtype of each column.
+    """
+    import pyarrow as pa_
+
+    metadata = parquet_file.metadata
+    null_counts: dict[str, int] = {}
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            statistics = column.statistics
+            if statistics is not None and statistics.has_null_count:
+                null_count = statistics.null_count
+            else:
+                null_count = parquet_file.read_row_group(i, columns=[column.path_in_schema]).column(0).null_count
+            null_counts[column.path_in_schema] = null_counts.get(column.path_in_schema, 0) + null_count
+
+    schema = parquet_file.schema_arrow
+    df_empty = schema.empty_table().to_pandas()
+    df_nulls = pa_.Table.from_arrays([pa_.nulls(1, field.type) for field in schema], schema=schema).to_pandas()
+    dictionaries = {field.name for field in schema if pa_.types.is_dictionary(field.type)}
+    return {
+        name: df_nulls[name].dtype if null_counts.get(name) else dtype
+        for name, dtype in df_empty.dtypes.items()
+        if name not in dictionaries
+    }
+
+
+def cast_chunk(chunk: pd.DataFrame, dtypes: dict[Any, Any]) -> pd.DataFrame:
+    """
+    Cast the columns of a chunk whose dtype differs from the dtype of the file.
+
+    Args:
+        chunk (pd.DataFrame): The chunk to cast.
+        dtypes (dict[Any, Any]): The dtype of each column of the file.
+
+    Returns:
+        pd.DataFrame: The chunk with the dtypes of the file.
+    """
+    casts = {name: dtype for name, dtype in dtypes.items() if name in chunk.columns and chunk[name].dtype != dtype}
+    return chunk.astype(casts) if casts else chunk
+
+
+class ChunkWriter:
+    """
+    A writer appending validated chunks to a CSV or Parquet file.
+
+    Parameters:
+        path (Path): The file to write.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._suffix = path.suffix.lower()
+        self._parquet_writer = None
+        self._chunks = 0
+
+    def write(self, df: pd.DataFrame):
+        """
+        Append a chunk to the output file.
+
+        Args:
+            df (pd.DataFrame): The chunk to write.
+        """
+        if self._suffix in CSV_SUFFIXES:
+            df.to_csv(self.path, mode="a" if self._chunks else "w", header=not self._chunks, index=False)
+        else:
+            import pyarrow as pa_
+            import pyarrow.parquet as pq
+
+            if self._parquet_writer is None:
+                table = pa_.Table.from_pandas(df, preserve_index=False)
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            else:
+                table = pa_.Table.from_pandas(df, schema=self._parquet_writer.schema, preserve_index=False)
+            self._parquet_writer.write_table(table)
+
+        self._chunks += 1
+
+    def close(self):
+        """
+        Close the output file.
+        """
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class _NullWriter:
+    """
+    A writer discarding all chunks, used if no output directory is given.
+    """
+
+    def write(self, df: pd.DataFrame):  # pylint: disable=unused-argument
+        """
+        Discard a chunk.
+        """
+
+    def __enter__(self) -> "_NullWriter":
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def validate_file(
+    path: Path,
+    schema_spec: str,
+    output: Optional[Path] = None,
+    chunksize: Optional[int] = None,
+    columns: Optional[QualityColumnsOptions] = None,
+    native: bool = False,
+    deduplicate: bool = False,
+    project_columns: bool = False,
+) -> FileSummary:
+    """
+    Validate a single file chunk by chunk and write the enriched chunks to the output file.
+
+    Args:
+        path (Path): The file to validate.
+        schema_spec (str): The schema to validate against, see `load_schema`.
+        output (Optional[Path]): Optional. The file to write the enriched chunks to.
+            If not provided, no output is written.
+        chunksize (Optional[int]): Optional. The number of rows per chunk.
+        columns (Optional[QualityColumnsOptions]): Optional. The names of quality columns.
+        native (bool): Whether to compute built-in checks with the native check engine. Defaults to False.
+        deduplicate (bool): Whether to validate only the unique rows of each chunk. Defaults to False.
+        project_columns (bool): Whether to hand only the columns the schema validates to pandera. Defaults to False.
+
+    Returns:
+        FileSummary: The validation summary of the file.
+    """
+    start = time.perf_counter()
+    summary: FileSummary = {
+        "input": str(path),
+        "output": str(output) if output else None,
+        "rows": 0,
+        "invalid_rows": 0,
+        "chunks": 0,
+        "is_valid": False,
+        "seconds": 0.0,
+        "error": None,
+    }
+
+    try:
+        schema = load_schema(schema_spec)
+        validator = DataFrameValidator(
+            columns=columns,
+            engine=NativeCheckEngine() if native else None,
+            deduplicate=deduplicate,
+            project_columns=project_columns,
+        )
+        col_status = validator.columns["status"]
+
+        if output:
+            output.parent.mkdir(parents=True, exist_ok=True)
+
+        is_valid = True
+        with ChunkWriter(output) if output else _NullWriter() as writer:
+            for chunk in read_chunks(path, chunksize):
+                chunk_valid, chunk = validator.validate(schema, chunk, validity_flag=True)
+                is_valid &= chunk_valid
+                summary["rows"] += len(chunk)
+                summary["invalid_rows"] += int((chunk[col_status] == QUALITY_STATUS_OPTIONS["invalid"]).sum())
+                summary["chunks"] += 1
+                writer.write(chunk)
+
+        summary["is_valid"] = is_valid
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        summary["error"] = f"{type(error).__name__}: {error}"
+
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def run(
+    schema_spec: str,
+    paths: Sequence[Path],
+    output_dir: Optional[Path] = None,
+    chunksize: Optional[int] = None,
+    workers: Optional[int] = None,
+    columns: Optional[QualityColumnsOptions] = None,
+    native: bool = False,
+    deduplicate: bool = False,
+    project_columns: bool = False,
+) -> RunSummary:
+    """
+    Validate files in parallel across a pool of worker processes.
+
+    Args:
+        schema_spec (str): The schema to validate against, see `load_schema`.
+        paths (Sequence[Path]): The files to validate.
+        output_dir (Optional[Path]): Optional. The directory to write the enriched files to.
+        chunksize (Optional[int]): Optional. The number of rows per chunk.
+        workers (Optional[int]): Optional. The number of worker processes. Defaults to the number of CPUs.
+            With a single worker, files are validated in the current process.
+        columns (Optional[QualityColumnsOptions]): Optional. The names of quality columns.
+        native (bool): Whether to compute built-in checks with the native check engine. Defaults to False.
+        deduplicate (bool): Whether to validate only the unique rows of each chunk. Defaults to False.
+        project_columns (bool): Whether to hand only the columns the schema validates to pandera. Defaults to False.
+
+    Returns:
+        RunSummary: The summary of the run.
+    """
+    start = time.perf_counter()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths) or 1))
+
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    outputs = output_paths(paths, output_dir)
+    func = partial(
+        validate_file,
+        schema_spec=schema_spec,
+        chunksize=chunksize,
+        columns=columns,
+        native=native,
+        deduplicate=deduplicate,
+        project_columns=project_columns,
+    )
+
+    if workers == 1:
+        files = [func(path, output=output) for path, output in zip(paths, outputs)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, path, output=output) for path, output in zip(paths, outputs)]
+            files = [future.result() for future in futures]
+
+    return {
+        "schema": schema_spec,
+        "workers": workers,
+        "files": files,
+        "rows": sum(file["rows"] for file in files),
+        "invalid_rows": sum(file["invalid_rows"] for file in files),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the command-line interface.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pandera-report",
+        description="Validate CSV and Parquet files against a pandera schema and report quality issues per row.",
+    )
+    parser.add_argument(
+        "schema",
+        help="Import path of a DataFrameModel or DataFrameSchema (package.module:Name) or path to a pandera YAML schema.",
+    )
+    parser.add_argument("inputs", nargs="+", help="Glob patterns of the CSV or Parquet files to validate.")
+    parser.add_argument("-o", "--output-dir", type=Path, help="Directory to write the enriched files to.")
+    parser.add_argument(
+        "-s",
+        "--summary",
+        type=Path,
+        help="Path of the JSON run summary. Defaults to 'summary.json' in the output directory, otherwise stdout.",
+    )
+    parser.add_argument("-w", "--workers", type=int, help="Number of worker processes. Defaults to the number of CPUs.")
+    parser.add_argument("-c", "--chunksize", type=int, help="Number of rows per chunk for streaming large files.")
+    parser.add_argument("--issues-column", default=DEFAULT_QUALITY_ISSUES_COLUMN, help="Name of the issues column.")
+    parser.add_argument("--status-column", default=DEFAULT_QUALITY_STATUS_COLUMN, help="Name of the status column.")
+    parser.add_argument(
+        "--native",
+        action="store_true",
+        help="Compute built-in checks natively instead of building pandera's failure cases.",
+    )
+    parser.add_argument(
+        "--deduplicate",
+        action="store_true",
+        help="Validate only the unique rows of each chunk and broadcast their quality issues.",
+    )
+    parser.add_argument(
+        "--project-columns",
+        action="store_true",
+        help="Hand only the columns the schema validates to pandera.",
+    )
+    parser.add_argument(
+        "--fail-on-invalid",
+        action="store_true",
+        help="Exit with a non-zero status if any row is invalid.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv (Optional[Sequence[str]]): Optional. The command-line arguments. Defaults to `sys.argv`.
+
+    Returns:
+        int: The exit status. 1 if a file could not be processed or, with `--fail-on-invalid`,
+            if any row is invalid; 0 otherwise.
+    """
+    args = build_parser().parse_args(argv)
+
+    paths = expand_paths(args.inputs)
+    if not paths:
+        print(f"No files match {' '.join(args.inputs)}")
+        return 1
+
+    columns: QualityColumnsOptions = {"issues": args.issues_column, "status": args.status_column}
+    summary = run(
+        args.schema,
+        paths,
+        args.output_dir,
+        args.chunksize,
+        args.workers,
+        columns,
+        args.native,
+        args.deduplicate,
+        args.project_columns,
+    )
+
+    summary_path = args.summary or (args.output_dir / "summary.json" if args.output_dir else None)
+    content = json.dumps(summary, indent=2)
+    if summary_path:
+        summary_path.write_text(content, encoding="utf-8")
+    else:
+        print(content)
+
+    if any(file["error"] for file in summary["files"]):
+        return 1
+    if args.fail_on_invalid and summary["invalid_rows"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
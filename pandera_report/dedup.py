@@ -0,0 +1,182 @@
+import copy
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+ROW_WISE_CHECKS = frozenset(
+    {
+        "equal_to",
+        "not_equal_to",
+        "greater_than",
+        "greater_than_or_equal_to",
+        "less_than",
+        "less_than_or_equal_to",
+        "in_range",
+        "isin",
+        "notin",
+        "str_matches",
+        "str_contains",
+        "str_startswith",
+        "str_endswith",
+        "str_length",
+    }
+)
+
+
+def is_row_wise_check(check: pa.Check) -> bool:
+    """
+    Check whether the result of a check for a row only depends on the values of that row.
+
+    Args:
+        check (pa.Check): The Pandera check.
+
+    Returns:
+        bool: True, if the check is element-wise or an unmodified row-wise built-in check.
+    """
+    if check.groupby is not None or check.n_failure_cases is not None:
+        return False
+
+    if check.element_wise:
+        return True
+
+    return (
+        check.name in ROW_WISE_CHECKS
+        and check.name in pa.Check.CHECK_FUNCTION_REGISTRY
+        and check._check_fn == pa.Check.get_builtin_check_fn(check.name)
+    )
+
+
+def split_frame_wide_schema(
+    schema: pa.DataFrameSchema,
+) -> tuple[pa.DataFrameSchema, Optional[pa.DataFrameSchema]]:
+    """
+    Split a schema into a row-wise schema and a schema of the dataframe-wide checks.
+
+    The row-wise schema can be validated on the unique rows of a DataFrame. Uniqueness, the index,
+    grouped, limited and custom vectorized checks depend on the other rows and are moved into
+    a schema which is validated on the complete DataFrame. It does not check dtypes, presence or nulls again.
+
+    Args:
+        schema (pa.DataFrameSchema): The Pandera schema.
+
+    Returns:
+        Tuple[pa.DataFrameSchema, Optional[pa.DataFrameSchema]]: The row-wise schema and the schema
+            of the dataframe-wide checks or None, if there are none.
+    """
+    row_schema = copy.deepcopy(schema)
+    frame_columns: dict[str, pa.Column] = {}
+
+    for name, column in schema.columns.items():
+        frame_checks = [check for check in column.checks if not is_row_wise_check(check)]
+        if not frame_checks and not column.unique:
+            continue
+
+        row_column = row_schema.columns[name]
+        row_column.checks = [check for check in column.checks if is_row_wise_check(check)]
+        row_column.unique = False
+
+        frame_columns[name] = pa.Column(
+            checks=frame_checks,
+            nullable=True,
+            unique=column.unique,
+            report_duplicates=column.report_duplicates,
+            required=False,
+            name=name,
+            regex=column.regex,
+        )
+
+    frame_checks = [check for check in schema.checks if not is_row_wise_check(check)]
+    row_schema.checks = [check for check in schema.checks if is_row_wise_check(check)]
+    row_schema.unique = None
+    row_schema.index = None
+
+    if not frame_columns and not frame_checks and schema.unique is None and schema.index is None:
+        return row_schema, None
+
+    frame_schema = pa.DataFrameSchema(
+        frame_columns,
+        checks=frame_checks,
+        index=schema.index,
+        name=schema.name,
+        unique=schema.unique,
+        report_duplicates=schema.report_duplicates,
+    )
+    return row_schema, frame_schema
+
+
+def factorize_rows(df: pd.DataFrame) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """
+    Factorize the rows of a DataFrame by their values.
+
+    Values of object columns are also distinguished by their type, because equal values
+    of different types, e.g. 1, 1.0 and True, may pass different checks.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to factorize.
+
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray]]: The position of the first occurrence of each unique row and
+            the code of the unique row of each row or None, if the values cannot be hashed.
+    """
+    inverse = np.zeros(len(df), dtype=np.int64)
+    number_of_unique = 1
+
+    keys: list[pd.Series] = []
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        keys.append(series)
+        if series.dtype == object:
+            keys.append(series.map(type))
+
+    try:
+        for key in keys:
+            codes, uniques = pd.factorize(key, use_na_sentinel=False)
+            combined = inverse * len(uniques) + codes
+            inverse, uniques = pd.factorize(combined)
+            number_of_unique = len(uniques)
+    except TypeError:
+        return None
+
+    inverse = inverse.astype(np.int64)
+    positions = np.full(number_of_unique, len(df), dtype=np.int64)
+    np.minimum.at(positions, inverse, np.arange(len(df)))
+    return positions, inverse
+
+
+def concat_ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """
+    Concatenate the integer ranges between pairs of starts and stops.
+
+    Args:
+        starts (np.ndarray): The inclusive starts of the ranges.
+        stops (np.ndarray): The exclusive stops of the ranges.
+
+    Returns:
+        np.ndarray: The concatenated ranges.
+    """
+    lengths = stops - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum(), dtype=np.int64) + np.repeat(starts - offsets, lengths)
+
+
+def broadcast_failure_codes(references: np.ndarray, inverse: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Broadcast failure cases of unique rows to all rows with the same values.
+
+    Args:
+        references (np.ndarray): The unique row position of each failure case.
+        inverse (np.ndarray): The code of the unique row of each row, see `factorize_rows`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row position of each broadcast failure case and
+            the position of the failure case it was broadcast from.
+    """
+    order = np.argsort(inverse, kind="stable")
+    counts = np.bincount(inverse, minlength=int(references.max(initial=-1)) + 1)
+    starts = np.cumsum(counts) - counts
+
+    repeats = counts[references]
+    rows = order[concat_ranges(starts[references], starts[references] + repeats)]
+    return rows, np.repeat(np.arange(len(references)), repeats)
@@ -0,0 +1,297 @@
+import operator
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+NOT_NULLABLE_CHECK = "not_nullable"
+LABEL_COLUMNS = ["column", "check"]
+
+
+def _compare(op: Callable[[Any, Any], Any], key: str) -> Callable[[pd.Series, dict[str, Any]], np.ndarray]:
+    def check(series: pd.Series, statistics: dict[str, Any]) -> np.ndarray:
+        return op(series.to_numpy(), statistics[key])
+
+    return check
+
+
+def _in_range(series: pd.Series, statistics: dict[str, Any]) -> np.ndarray:
+    values = series.to_numpy()
+    left_op = operator.le if statistics.get("include_min", True) else operator.lt
+    right_op = operator.ge if statistics.get("include_max", True) else operator.gt
+    return left_op(statistics["min_value"], values) & right_op(statistics["max_value"], values)
+
+
+def _isin(series: pd.Series, statistics: dict[str, Any]) -> np.ndarray:
+    return series.isin(statistics["allowed_values"]).to_numpy()
+
+
+def _notin(series: pd.Series, statistics: dict[str, Any]) -> np.ndarray:
+    return ~series.isin(statistics["forbidden_values"]).to_numpy()
+
+
+def _str_startswith(series: pd.Series, statistics: dict[str, Any]) -> np.ndarray:
+    return series.str.startswith(statistics["string"], na=False).to_numpy(dtype=bool)
+
+
+def _str_endswith(series: pd.Series, statistics: dict[str, Any]) -> np.ndarray:
+    return series.str.endswith(statistics["string"], na=False).to_numpy(dtype=bool)
+
+
+NATIVE_CHECKS: dict[str, Callable[[pd.Series, dict[str, Any]], np.ndarray]] = {
+    "equal_to": _compare(operator.eq, "value"),
+    "not_equal_to": _compare(operator.ne, "value"),
+    "greater_than": _compare(operator.gt, "min_value"),
+    "greater_than_or_equal_to": _compare(operator.ge, "min_value"),
+    "less_than": _compare(operator.lt, "max_value"),
+    "less_than_or_equal_to": _compare(operator.le, "max_value"),
+    "in_range": _in_range,
+    "isin": _isin,
+    "notin": _notin,
+    "str_startswith": _str_startswith,
+    "str_endswith": _str_endswith,
+}
+
+
+class NativeCheckEngine:
+    """
+    An engine computing failing rows of built-in checks directly as boolean masks.
+
+    Built-in checks and the nullable check of plain columns are taken out of the schema and evaluated
+    with vectorized NumPy and pandas operations. Everything else, e.g. custom checks, dtypes, column presence
+    or uniqueness, is left in a residual schema which is still validated by pandera.
+
+    Parameters:
+        checks (Optional[dict[str, Callable]], optional): The native implementations by built-in check name.
+            Each receives the non-null values of a column and the check's statistics and returns
+            a boolean mask of the passing values. If not provided, the default implementations are used.
+    """
+
+    def __init__(self, checks: Optional[dict[str, Callable[[pd.Series, dict[str, Any]], np.ndarray]]] = None):
+        self.checks = NATIVE_CHECKS if checks is None else checks
+
+    def is_native_check(self, check: pa.Check) -> bool:
+        """
+        Check whether a check can be computed natively.
+
+        Args:
+            check (pa.Check): The Pandera check.
+
+        Returns:
+            bool: True, if the check is an unmodified built-in check with a native implementation.
+        """
+        if check.name not in self.checks or check.name not in pa.Check.CHECK_FUNCTION_REGISTRY:
+            return False
+
+        return (
+            check._check_fn == pa.Check.get_builtin_check_fn(check.name)
+            and check.ignore_na
+            and not check.element_wise
+            and not check.raise_warning
+            and check.groupby is None
+            and check.n_failure_cases is None
+        )
+
+    def split_schema(
+        self, schema: pa.DataFrameSchema
+    ) -> tuple[pa.DataFrameSchema, dict[str, tuple[bool, list[pa.Check]]]]:
+        """
+        Split a schema into a residual schema for pandera and the natively computed checks.
+
+        Columns which are coerced, matched by a regex or parsed are left to pandera completely.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema.
+
+        Returns:
+            Tuple[pa.DataFrameSchema, dict[str, Tuple[bool, list[pa.Check]]]]: The residual schema and,
+                per column, whether nulls are checked natively and the natively computed checks.
+        """
+        if schema.coerce:
+            return schema, {}
+
+        native: dict[str, tuple[bool, list[pa.Check]]] = {}
+        updates: dict[str, dict[str, Any]] = {}
+
+        for name, column in schema.columns.items():
+            if column.coerce or column.regex or column.parsers:
+                continue
+
+            checks = [check for check in column.checks if self.is_native_check(check)]
+            nullable = not column.nullable
+            if not checks and not nullable:
+                continue
+
+            native[name] = (nullable, checks)
+            updates[name] = {
+                "checks": [check for check in column.checks if not self.is_native_check(check)],
+                "nullable": True,
+            }
+
+        if not updates:
+            return schema, native
+
+        return schema.update_columns(updates), native
+
+    def run_checks(
+        self, df: pd.DataFrame, native: dict[str, tuple[bool, list[pa.Check]]], factorize: bool = False
+    ) -> tuple[np.ndarray, np.ndarray, pd.DataFrame]:
+        """
+        Compute the failing rows of natively computed checks.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to check.
+            native (dict[str, Tuple[bool, list[pa.Check]]]): The natively computed checks, see `split_schema`.
+            factorize (bool, optional): Whether to check only the unique values of string and categorical columns
+                and broadcast the results to all rows. Defaults to False.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, pd.DataFrame]: The row positions of the failure cases,
+                the codes of their labels and the labels with a "column" and a "check" column.
+        """
+        references: list[np.ndarray] = []
+        codes: list[np.ndarray] = []
+        labels: list[tuple[str, str]] = []
+
+        for name, (nullable, checks) in native.items():
+            if name not in df.columns:
+                continue
+
+            series = df[name]
+            isna = series.isna().to_numpy()
+            notna = ~isna
+            values = series[notna] if isna.any() else series
+
+            value_codes: Optional[np.ndarray] = None
+            if factorize and checks and not pd.api.types.is_numeric_dtype(values.dtype):
+                try:
+                    value_codes, uniques = pd.factorize(values)
+                    values = pd.Series(uniques, name=name)
+                except TypeError:
+                    value_codes = None
+
+            masks: list[tuple[str, np.ndarray]] = []
+            if nullable:
+                masks.append((NOT_NULLABLE_CHECK, isna))
+
+            for check in checks:
+                try:
+                    passing = np.asarray(self.checks[check.name](values, check.statistics), dtype=bool)
+                    failing = notna.copy()
+                    failing[notna] = ~passing if value_codes is None else ~passing[value_codes]
+                except (AttributeError, TypeError, ValueError):
+                    failing = np.ones(len(series), dtype=bool)
+                masks.append((check.error or check.name, failing))
+
+            for label, failing in masks:
+                positions = np.flatnonzero(failing)
+                if not len(positions):
+                    continue
+
+                references.append(positions)
+                codes.append(np.full(len(positions), len(labels)))
+                labels.append((name, label))
+
+        if not labels:
+            return empty_failure_codes()
+
+        return np.concatenate(references), np.concatenate(codes), pd.DataFrame(labels, columns=LABEL_COLUMNS)
+
+
+def rank_labels(schema: pa.DataFrameSchema, labels: pd.DataFrame) -> np.ndarray:
+    """
+    Rank failure labels by the position of their column and check in the schema.
+
+    Labels of a column in the schema are ranked by the column's position, with the not-nullable check first,
+    followed by other failures of the column in the given order, e.g. uniqueness, dtypes or dataframe-wide checks,
+    and the column's checks. Labels of columns outside of the schema, e.g. of the index or unexpected columns,
+    are ranked first in the given order.
+
+    Args:
+        schema (pa.DataFrameSchema): The Pandera schema.
+        labels (pd.DataFrame): The labels with a "column" and a "check" column.
+
+    Returns:
+        np.ndarray: The rank of each label.
+    """
+    column_positions: dict[Any, int] = {}
+    positions: dict[tuple[Any, str], tuple[int, int]] = {}
+    for column_position, (name, column) in enumerate(schema.columns.items()):
+        column_positions[name] = column_position
+        positions[(name, NOT_NULLABLE_CHECK)] = (column_position, -2)
+        for check_position, check in enumerate(column.checks):
+            positions.setdefault((name, check.error or check.name), (column_position, check_position))
+
+    keys = []
+    for position, (name, check) in enumerate(zip(labels["column"], labels["check"])):
+        if (name, check) in positions:
+            keys.append((1, *positions[(name, check)], position))
+        elif name in column_positions:
+            keys.append((1, column_positions[name], -1, position))
+        else:
+            keys.append((0, 0, 0, position))
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.arange(len(keys))
+    return ranks
+
+
+def empty_failure_codes() -> tuple[np.ndarray, np.ndarray, pd.DataFrame]:
+    """
+    Create label codes per row reference without any failure case.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, pd.DataFrame]: Empty row positions, label codes and labels.
+    """
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), pd.DataFrame(columns=LABEL_COLUMNS)
+
+
+def failure_cases_to_codes(df_failure: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, pd.DataFrame]:
+    """
+    Convert a transformed failure cases DataFrame into label codes per row reference.
+
+    Args:
+        df_failure (pd.DataFrame): The failure cases with a "reference", a "column" and a "check" column.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, pd.DataFrame]: The row positions of the failure cases,
+            the codes of their labels and the labels with a "column" and a "check" column.
+    """
+    if df_failure.empty:
+        return empty_failure_codes()
+
+    keys = pd.MultiIndex.from_arrays([df_failure["column"], df_failure["check"]], names=LABEL_COLUMNS)
+    codes, uniques = keys.factorize()
+    references = df_failure["reference"].to_numpy().astype(np.int64)
+    return references, codes.astype(np.int64), uniques.to_frame(index=False, name=LABEL_COLUMNS)
+
+
+def concat_failure_codes(
+    *parts: tuple[np.ndarray, np.ndarray, pd.DataFrame]
+) -> tuple[np.ndarray, np.ndarray, pd.DataFrame]:
+    """
+    Concatenate label codes per row reference, keeping the order of the parts.
+
+    Args:
+        *parts (Tuple[np.ndarray, np.ndarray, pd.DataFrame]): The row positions, label codes and labels to concatenate.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, pd.DataFrame]: The row positions of the failure cases,
+            the codes of their labels and the labels with a "column" and a "check" column.
+    """
+    parts = tuple(part for part in parts if len(part[0]))
+    if not parts:
+        return empty_failure_codes()
+
+    offsets = np.cumsum([0] + [len(labels) for _, _, labels in parts[:-1]])
+    return (
+        np.concatenate([references for references, _, _ in parts]),
+        np.concatenate([codes + offset for (_, codes, _), offset in zip(parts, offsets)]),
+        pd.concat([labels[LABEL_COLUMNS] for _, _, labels in parts], ignore_index=True),
+    )
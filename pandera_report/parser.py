@@ -7,6 +7,30 @@ import pandas as pd
 from .options import QUALITY_STATUS_OPTIONS, QualityStatusOptions
 
 
+def expand_failure_codes(
+    references: np.ndarray, codes: np.ndarray, labels: pd.DataFrame, failure_cases: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """
+    Expand failure cases given as label codes per row reference into a failure cases DataFrame.
+
+    Args:
+        references (np.ndarray): The row position of each failure case.
+        codes (np.ndarray): The position of each failure case's label in `labels`.
+        labels (pd.DataFrame): The distinct failure labels with a "column" and a "check" column.
+        failure_cases (Optional[pd.DataFrame]): Optional. The original failure cases in the order of `codes`.
+            If provided, their references are replaced instead of expanding the labels.
+
+    Returns:
+        pd.DataFrame: The failure cases with a "reference", a "column" and a "check" column.
+    """
+    if failure_cases is not None:
+        return failure_cases.reset_index(drop=True).assign(reference=references)
+
+    df = labels[["column", "check"]].take(codes).reset_index(drop=True)
+    df.insert(0, "reference", references)
+    return df
+
+
 class FailureCaseParserProtocol(Protocol):
     """
     An abstract base class for pandera's failure cases dataframe.
@@ -53,6 +77,33 @@ class FailureCaseParser(FailureCaseParserProtocol):
     def parse_failure_cases(self, df: pd.DataFrame, number_of_rows: int) -> tuple[pd.Series, pd.Series]:
         return NotImplemented
 
+    def parse_failure_codes(
+        self,
+        references: np.ndarray,
+        codes: np.ndarray,
+        labels: pd.DataFrame,
+        number_of_rows: int,
+        failure_cases: Optional[pd.DataFrame] = None,
+    ) -> tuple[pd.Series, pd.Series]:
+        """
+        Parse failure cases given as label codes per row reference.
+
+        The original failure cases, or the labels expanded into a DataFrame, are passed to
+        `parse_failure_cases`, so parsers only have to implement the latter.
+
+        Args:
+            references (np.ndarray): The row position of each failure case.
+            codes (np.ndarray): The position of each failure case's label in `labels`.
+            labels (pd.DataFrame): The distinct failure labels with a "column" and a "check" column.
+            number_of_rows (int): The number of rows to generate in the resulting series.
+            failure_cases (Optional[pd.DataFrame]): Optional. The original failure cases in the order of `codes`.
+                If provided, they are passed to `parse_failure_cases` instead of the expanded labels.
+
+        Returns:
+            Tuple[pd.Series, pd.Series]: A tuple containing the quality issues and status series.
+        """
+        return self.parse_failure_cases(expand_failure_codes(references, codes, labels, failure_cases), number_of_rows)
+
     def create_quality_issues_series(self, df: pd.DataFrame) -> pd.Series:
         return NotImplemented
 
@@ -82,6 +133,8 @@ class DefaultFailureCaseParser(FailureCaseParser):
     invalid_status: str
     none_status: str
 
+    separator = " | "
+
     def parse_failure_cases(self, df: pd.DataFrame, number_of_rows: int):
         """
         Parse failure cases from a DataFrame and create corresponding quality issues and status series.
@@ -97,6 +150,78 @@ class DefaultFailureCaseParser(FailureCaseParser):
         series_status = self.create_quality_status_series(series_issues)
         return series_issues, series_status
 
+    def parse_failure_codes(
+        self,
+        references: np.ndarray,
+        codes: np.ndarray,
+        labels: pd.DataFrame,
+        number_of_rows: int,
+        failure_cases: Optional[pd.DataFrame] = None,
+    ) -> tuple[pd.Series, pd.Series]:
+        """
+        Parse failure cases given as label codes per row reference.
+
+        Each label is formatted once and the issues of a row are joined without grouping a DataFrame.
+        If a subclass overrides the DataFrame based parsing, it is used instead.
+
+        Args:
+            references (np.ndarray): The row position of each failure case.
+            codes (np.ndarray): The position of each failure case's label in `labels`.
+            labels (pd.DataFrame): The distinct failure labels with a "column" and a "check" column.
+            number_of_rows (int): The number of rows to generate in the resulting series.
+            failure_cases (Optional[pd.DataFrame]): Optional. The original failure cases in the order of `codes`,
+                only used if the DataFrame based parsing is overridden.
+
+        Returns:
+            Tuple[pd.Series, pd.Series]: A tuple containing the quality issues and status series.
+        """
+        cls = type(self)
+        if (
+            cls.parse_failure_cases is not DefaultFailureCaseParser.parse_failure_cases
+            or cls.create_quality_issues_series is not DefaultFailureCaseParser.create_quality_issues_series
+            or cls.create_quality_issues is not DefaultFailureCaseParser.create_quality_issues
+        ):
+            return super().parse_failure_codes(references, codes, labels, number_of_rows, failure_cases)
+
+        cases = np.array(
+            [self.create_failure_case(col, ch) for col, ch in zip(labels["column"], labels["check"])], dtype=object
+        )
+        series_issues = pd.Series(self.join_failure_codes(references, cases[codes], number_of_rows))
+        series_status = self.create_quality_status_series(series_issues)
+        return series_issues, series_status
+
+    def join_failure_codes(self, references: np.ndarray, cases: np.ndarray, number_of_rows: int) -> np.ndarray:
+        """
+        Join formatted failure cases per row reference.
+
+        Args:
+            references (np.ndarray): The row position of each failure case.
+            cases (np.ndarray): The formatted failure cases.
+            number_of_rows (int): The number of rows to generate in the resulting array.
+
+        Returns:
+            np.ndarray: The quality issues per row, filled with the "none" quality status.
+        """
+        issues = np.full(number_of_rows, self.none_status, dtype=object)
+        if not len(references):
+            return issues
+
+        order = np.argsort(references, kind="stable")
+        references, cases = references[order], cases[order]
+
+        starts = np.flatnonzero(np.r_[True, references[1:] != references[:-1]])
+        counts = np.diff(np.r_[starts, len(references)])
+        ranks = np.arange(len(references)) - np.repeat(starts, counts)
+        groups = np.repeat(np.arange(len(starts)), counts)
+
+        joined = cases[starts]
+        for rank in range(1, counts.max()):
+            mask = ranks == rank
+            joined[groups[mask]] = joined[groups[mask]] + self.separator + cases[mask]
+
+        issues[references[starts]] = joined
+        return issues
+
     def create_quality_issues_series(self, df: pd.DataFrame, number_of_rows: int) -> pd.Series:
         """
         Create a quality issues series from a DataFrame of failure cases.
@@ -127,7 +252,7 @@ class DefaultFailureCaseParser(FailureCaseParser):
         """
         cases = [self.create_failure_case(col, ch) for col, ch in zip(df.column, df.check)]
 
-        return " | ".join(cases)
+        return self.separator.join(cases)
 
     def create_failure_case(self, column: str, check: str) -> str:
         """
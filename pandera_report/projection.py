@@ -0,0 +1,89 @@
+import re
+from typing import (
+    Any,
+    Optional,
+    Sequence,
+)
+
+import pandas as pd
+import pandera as pa
+
+
+def infer_columns(schema: pa.DataFrameSchema, df: pd.DataFrame) -> Optional[list[Any]]:
+    """
+    Infer the columns of a DataFrame a schema validates.
+
+    Args:
+        schema (pa.DataFrameSchema): The Pandera schema.
+        df (pd.DataFrame): The DataFrame to validate.
+
+    Returns:
+        Optional[list[Any]]: The columns of the DataFrame in their original order or None, if the schema
+            depends on all columns, e.g. because it is strict or has dataframe-wide checks,
+            or validates all columns anyway.
+    """
+    if (
+        schema.strict
+        or schema.checks
+        or schema.dtype is not None
+        or schema.unique_column_names
+        or schema.drop_invalid_rows
+    ):
+        return None
+
+    names = set(schema.unique or [])
+    for name, column in schema.columns.items():
+        if not column.regex:
+            names.add(name)
+        elif isinstance(name, tuple):
+            return None
+        else:
+            names.update(col for col in df.columns if re.match(name, str(col)))
+
+    columns = [col for col in df.columns if col in names]
+    return columns if len(columns) < df.shape[1] else None
+
+
+def project_schema(schema: pa.DataFrameSchema, columns: Sequence[Any]) -> pa.DataFrameSchema:
+    """
+    Select the columns of a schema which validate a subset of columns.
+
+    Dataframe-wide checks are dropped, as well as uniqueness across columns outside of the subset.
+
+    Args:
+        schema (pa.DataFrameSchema): The Pandera schema.
+        columns (Sequence[Any]): The subset of columns.
+
+    Returns:
+        pa.DataFrameSchema: The schema of the subset of columns.
+    """
+    names = [
+        name
+        for name, column in schema.columns.items()
+        if name in columns or (column.regex and any(re.match(str(name), str(col)) for col in columns))
+    ]
+
+    projected = schema.select_columns(names)
+    projected.checks = []
+    if projected.unique and not set(projected.unique) <= set(columns):
+        projected.unique = None
+    return projected
+
+
+def assign_columns(frame: pd.DataFrame, data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Assign the columns of a projected DataFrame to the DataFrame it was projected from.
+
+    The result is a shallow copy of the frame, so the columns which are not assigned are not copied.
+
+    Args:
+        frame (pd.DataFrame): The full DataFrame.
+        data (pd.DataFrame): The projected DataFrame with the same index.
+
+    Returns:
+        pd.DataFrame: The full DataFrame with the columns of the projected DataFrame.
+    """
+    df = frame.copy(deep=False)
+    for name in data.columns:
+        df[name] = data[name]
+    return df
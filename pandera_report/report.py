@@ -0,0 +1,368 @@
+import copy
+from typing import (
+    cast,
+    Optional,
+    overload,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from pandera_report.dedup import broadcast_failure_codes, concat_ranges
+from pandera_report.engine import empty_failure_codes, LABEL_COLUMNS
+from pandera_report.options import QUALITY_COLUMNS_OPTIONS, QualityColumnsOptions
+from pandera_report.parser import DefaultFailureCaseParser, expand_failure_codes, FailureCaseParserProtocol
+from pandera_report.projection import assign_columns
+
+
+class QualityReport:
+    """
+    A quality report of a validated DataFrame which formats quality issues on demand.
+
+    The failure cases are held as row positions and codes into a table of distinct (column, check) labels.
+    Issue strings are only formatted by the parser for the rows requested, e.g. a single row, a slice
+    or all rows when the report is materialized to a Series or DataFrame.
+
+    If `inverse` is given, the failure cases refer to the unique rows of the DataFrame. Issues are formatted
+    once per unique row and broadcast to all rows with the same values.
+
+    Parameters:
+        data (pd.DataFrame): The validated DataFrame.
+        is_valid (bool): Whether the DataFrame is valid.
+        references (Optional[np.ndarray], optional): The row position of each failure case.
+        codes (Optional[np.ndarray], optional): The position of each failure case's label in `labels`.
+        labels (Optional[pd.DataFrame], optional): The distinct failure labels with a "column" and a "check" column.
+        failure_cases (Optional[pd.DataFrame], optional): The original failure cases in the order of `codes`,
+            passed to parsers which override the DataFrame based parsing.
+        parser (Optional[FailureCaseParserProtocol], optional): The failure case parser to format issues with.
+            If not provided, the default parser is used.
+        columns (Optional[QualityColumnsOptions], optional): The names of quality columns.
+            If not provided, default column names are used.
+        issues (Optional[np.ndarray], optional): Already formatted quality issues of all rows.
+        status (Optional[np.ndarray], optional): Already computed quality status of all rows.
+        inverse (Optional[np.ndarray], optional): The code of the unique row of each row.
+            If not provided, the failure cases refer to the rows of the DataFrame.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        is_valid: bool,
+        references: Optional[np.ndarray] = None,
+        codes: Optional[np.ndarray] = None,
+        labels: Optional[pd.DataFrame] = None,
+        failure_cases: Optional[pd.DataFrame] = None,
+        parser: Optional[FailureCaseParserProtocol] = None,
+        columns: Optional[QualityColumnsOptions] = None,
+        issues: Optional[np.ndarray] = None,
+        status: Optional[np.ndarray] = None,
+        inverse: Optional[np.ndarray] = None,
+    ):
+        if references is None or codes is None or labels is None:
+            references, codes, labels = empty_failure_codes()
+
+        references = np.asarray(references, dtype=np.int64)
+        number_of_rows = len(data) if inverse is None else int(inverse.max(initial=-1)) + 1
+        if len(references) and (references.min() < 0 or references.max() >= number_of_rows):
+            raise ValueError(f"Failure case references must be row positions in [0, {number_of_rows}).")
+
+        self._data = data
+        self._is_valid = is_valid
+        self._references = references
+        self._codes = np.asarray(codes, dtype=np.int64)
+        self._labels = labels[LABEL_COLUMNS]
+        self._failure_cases = failure_cases.reset_index(drop=True) if failure_cases is not None else None
+        self._parser = parser or DefaultFailureCaseParser()
+        self._columns = columns or QUALITY_COLUMNS_OPTIONS
+        self._issues = issues
+        self._status = status
+        self._inverse = inverse
+        self._frame: Optional[pd.DataFrame] = None
+        self._number_of_rows = number_of_rows
+        self._order: Optional[np.ndarray] = None
+        self._broadcast: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """
+        Get the validated DataFrame without quality columns.
+
+        Returns:
+            pd.DataFrame: The validated DataFrame.
+        """
+        return self._data
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """
+        Get the DataFrame the quality columns are assigned to.
+
+        Returns:
+            pd.DataFrame: The full DataFrame, if the validated DataFrame is a column projection of it,
+                otherwise the validated DataFrame.
+        """
+        return self._data if self._frame is None else self._frame
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Get the validity of the DataFrame.
+
+        Returns:
+            bool: True, if the DataFrame passed the validation.
+        """
+        return self._is_valid
+
+    @property
+    def references(self) -> np.ndarray:
+        """
+        Get the row position of each failure case.
+
+        Returns:
+            np.ndarray: The row positions.
+        """
+        if self._inverse is None:
+            return self._references
+        return self._broadcast_failure_codes()[0]
+
+    @property
+    def codes(self) -> np.ndarray:
+        """
+        Get the label code of each failure case.
+
+        Returns:
+            np.ndarray: The positions of the failure cases' labels in `labels`.
+        """
+        if self._inverse is None:
+            return self._codes
+        return self._codes[self._broadcast_failure_codes()[1]]
+
+    @property
+    def labels(self) -> pd.DataFrame:
+        """
+        Get the distinct failure labels.
+
+        Returns:
+            pd.DataFrame: The labels with a "column" and a "check" column.
+        """
+        return self._labels
+
+    @property
+    def failure_cases(self) -> Optional[pd.DataFrame]:
+        """
+        Get the original failure cases in the order of `codes`.
+
+        Returns:
+            Optional[pd.DataFrame]: The failure cases or None, if they are not available.
+        """
+        if self._inverse is None or self._failure_cases is None:
+            return self._failure_cases
+        return self._failure_cases.take(self._broadcast_failure_codes()[1]).reset_index(drop=True)
+
+    @property
+    def formatted_issues(self) -> Optional[np.ndarray]:
+        """
+        Get the quality issues of all rows, if they have already been formatted.
+
+        Returns:
+            Optional[np.ndarray]: The quality issues or None, if not all rows have been formatted yet.
+        """
+        return self._issues
+
+    @property
+    def formatted_status(self) -> Optional[np.ndarray]:
+        """
+        Get the quality status of all rows, if it has already been computed.
+
+        Returns:
+            Optional[np.ndarray]: The quality status or None, if it has not been computed yet.
+        """
+        return self._status
+
+    @property
+    def invalid_mask(self) -> np.ndarray:
+        """
+        Get a boolean mask of the rows with quality issues.
+
+        Returns:
+            np.ndarray: True for each row with at least one failure case.
+        """
+        mask = np.zeros(self._number_of_rows, dtype=bool)
+        mask[self._references] = True
+        return mask if self._inverse is None else mask[self._inverse]
+
+    @property
+    def invalid_rows(self) -> int:
+        """
+        Get the number of rows with quality issues.
+
+        Returns:
+            int: The number of invalid rows.
+        """
+        if self._inverse is None:
+            return int(np.unique(self._references).size)
+        return int(self.invalid_mask.sum())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, key: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> pd.Series:
+        ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[str, pd.Series]:
+        """
+        Format the quality issues of a row or a slice of rows.
+
+        Args:
+            key (int | slice): The position of a row or a slice of row positions.
+
+        Returns:
+            str | pd.Series: The quality issues of the row or a series of quality issues of the rows.
+        """
+        if isinstance(key, slice):
+            return self.issues(key)
+
+        position = range(len(self))[key]
+        return self.issues(slice(position, position + 1)).iloc[0]
+
+    def issues(self, rows: Optional[slice] = None) -> pd.Series:
+        """
+        Format the quality issues of a slice of rows.
+
+        Args:
+            rows (Optional[slice]): Optional. The slice of row positions. If not provided, all rows are formatted.
+
+        Returns:
+            pd.Series: The quality issues, indexed like the DataFrame.
+        """
+        positions = range(len(self))[rows or slice(None)]
+        if self._issues is None and len(positions) == len(self):
+            issues, status = self._format(np.arange(self._number_of_rows))
+            self._issues, self._status = self._take(issues), self._take(status)
+
+        if self._issues is not None:
+            values = self._issues[rows or slice(None)]
+        elif not len(positions):
+            values = np.empty(0, dtype=object)
+        else:
+            base_rows = np.asarray(positions) if self._inverse is None else self._inverse[positions]
+            ids, where = np.unique(base_rows, return_inverse=True)
+            values = self._format(ids)[0][where]
+
+        return pd.Series(values, index=self._data.index[rows or slice(None)], name=self._columns["issues"])
+
+    def status(self) -> pd.Series:
+        """
+        Get the quality status of all rows.
+
+        The status is derived from the failure cases without formatting issues,
+        unless the parser overrides how the status is created.
+
+        Returns:
+            pd.Series: The quality status, indexed like the DataFrame.
+        """
+        if self._status is None:
+            if type(self._parser).create_quality_status_series is DefaultFailureCaseParser.create_quality_status_series:
+                self._status = np.where(
+                    self.invalid_mask, self._parser.invalid_status, self._parser.valid_status
+                ).astype(object)
+            else:
+                self.issues()
+
+        return pd.Series(self._status, index=self._data.index, name=self._columns["status"])
+
+    def with_frame(self, frame: pd.DataFrame) -> "QualityReport":
+        """
+        Create a report whose quality columns are assigned to the full DataFrame the validated DataFrame
+        is a column projection of.
+
+        Args:
+            frame (pd.DataFrame): The full DataFrame with the same index as the validated DataFrame.
+
+        Returns:
+            QualityReport: The report assigned to the full DataFrame.
+        """
+        report = copy.copy(self)
+        report._frame = frame
+        return report
+
+    def to_series(self) -> pd.Series:
+        """
+        Materialize the quality issues of all rows.
+
+        Returns:
+            pd.Series: The quality issues, indexed like the DataFrame.
+        """
+        return self.issues()
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Materialize the report as the validated DataFrame with quality columns.
+
+        If the report is assigned to a full DataFrame, the validated columns and the quality columns are
+        assigned to a shallow copy of it, without copying the other columns.
+
+        Returns:
+            pd.DataFrame: The DataFrame with quality issues and status columns.
+        """
+        series_issues = self.issues()
+        if self._frame is None:
+            return self._data.assign(**{self._columns["issues"]: series_issues, self._columns["status"]: self.status()})
+
+        df = assign_columns(self._frame, self._data)
+        df[self._columns["issues"]] = series_issues
+        df[self._columns["status"]] = self.status()
+        return df
+
+    def to_failure_cases(self) -> pd.DataFrame:
+        """
+        Export the failure cases without formatting issues.
+
+        Returns:
+            pd.DataFrame: One row per failure case with a "reference", a "column" and a "check" column.
+        """
+        df = self._labels.take(self.codes).reset_index(drop=True)
+        df.insert(0, "reference", self.references)
+        return df
+
+    def _take(self, values: np.ndarray) -> np.ndarray:
+        return values if self._inverse is None else values[self._inverse]
+
+    def _broadcast_failure_codes(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._broadcast is None:
+            self._broadcast = broadcast_failure_codes(self._references, cast(np.ndarray, self._inverse))
+        return self._broadcast
+
+    def _format(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if len(rows) == self._number_of_rows:
+            return self._parse(self._references, np.arange(len(self._references)), len(rows))
+
+        if self._order is None:
+            self._order = np.argsort(self._references, kind="stable")
+
+        sorted_references = self._references[self._order]
+        lo = np.searchsorted(sorted_references, rows, side="left")
+        hi = np.searchsorted(sorted_references, rows, side="right")
+        selection = np.sort(self._order[concat_ranges(lo, hi)])
+        return self._parse(np.searchsorted(rows, self._references[selection]), selection, len(rows))
+
+    def _parse(
+        self, references: np.ndarray, selection: np.ndarray, number_of_rows: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        failure_cases = self._failure_cases.iloc[selection] if self._failure_cases is not None else None
+        codes = self._codes[selection]
+
+        if hasattr(self._parser, "parse_failure_codes"):
+            series_issues, series_status = self._parser.parse_failure_codes(
+                references, codes, self._labels, number_of_rows, failure_cases
+            )
+        else:
+            df_failure = expand_failure_codes(references, codes, self._labels, failure_cases)
+            series_issues, series_status = self._parser.parse_failure_cases(df_failure, number_of_rows)
+        return series_issues.to_numpy(dtype=object), series_status.to_numpy(dtype=object)
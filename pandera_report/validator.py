@@ -1,18 +1,31 @@
 from typing import (
+    Any,
     Callable,
     cast,
     Optional,
     overload,
+    Sequence,
     Type,
     Union,
 )
 
+import numpy as np
 import pandas as pd
 import pandera as pa
 from pandera.errors import SchemaError, SchemaErrors
 
+from pandera_report.cache import CacheEntry, schema_transforms_data, ValidationCache
+from pandera_report.dedup import broadcast_failure_codes, factorize_rows, split_frame_wide_schema
+from pandera_report.engine import (
+    concat_failure_codes,
+    failure_cases_to_codes,
+    NativeCheckEngine,
+    rank_labels,
+)
 from pandera_report.options import QUALITY_COLUMNS_OPTIONS, QualityColumnsOptions
 from pandera_report.parser import DefaultFailureCaseParser, FailureCaseParserProtocol
+from pandera_report.projection import assign_columns, infer_columns, project_schema
+from pandera_report.report import QualityReport
 
 
 class DataFrameValidator:
@@ -25,6 +38,16 @@ class DataFrameValidator:
         columns (Optional[QualityColumnsOptions], optional): The names of quality columns.
             If not provided, default column names are used.
         parser (Optional[FailureCaseParser], optional): The failure case parser to use. If not provided, the default parser is used.
+        cache (Optional[ValidationCache], optional): The cache to look up and store quality reports in.
+            If not provided, every DataFrame is validated.
+        engine (Optional[NativeCheckEngine], optional): The engine to compute built-in checks natively with.
+            It is only used for lazy validation with a quality report. If not provided, pandera runs all checks.
+        deduplicate (bool, optional): Whether to validate only the unique rows of a DataFrame and broadcast
+            their quality issues to all rows with the same values. Dataframe-wide checks, e.g. uniqueness,
+            still run on all rows. It is only used for lazy validation with a quality report. Defaults to False.
+        project_columns (bool, optional): Whether to hand only the columns a schema validates to pandera,
+            if no column subset is given. The result is assigned to the full DataFrame without copying
+            the other columns. Defaults to False.
     """
 
     def __init__(
@@ -33,14 +56,22 @@ class DataFrameValidator:
         lazy: bool = True,
         columns: Optional[QualityColumnsOptions] = None,
         parser: Optional[FailureCaseParserProtocol] = None,
+        cache: Optional[ValidationCache] = None,
+        engine: Optional[NativeCheckEngine] = None,
+        deduplicate: bool = False,
+        project_columns: bool = False,
     ):
         self.quality_report = quality_report
         self.lazy = lazy
+        self.deduplicate = deduplicate
+        self.project_columns = project_columns
         self._columns = columns or QUALITY_COLUMNS_OPTIONS
 
         self._col_issues = self._columns["issues"]
         self._col_status = self._columns["status"]
         self._parser = parser or DefaultFailureCaseParser()
+        self._cache = cache
+        self._engine = engine
 
         self._is_valid = None
 
@@ -60,6 +91,7 @@ class DataFrameValidator:
         schema: Union[Type[pa.DataFrameModel], pa.DataFrameSchema],
         df: pd.DataFrame,
         validity_flag: bool = False,
+        subset: Optional[Sequence[Any]] = None,
     ) -> pd.DataFrame:
         ...
 
@@ -69,6 +101,7 @@ class DataFrameValidator:
         schema: Union[Type[pa.DataFrameModel], pa.DataFrameSchema],
         df: pd.DataFrame,
         validity_flag: bool = True,
+        subset: Optional[Sequence[Any]] = None,
     ) -> tuple[bool, pd.DataFrame]:
         ...
 
@@ -77,6 +110,7 @@ class DataFrameValidator:
         schema: Union[Type[pa.DataFrameModel], pa.DataFrameSchema],
         df: pd.DataFrame,
         validity_flag: bool = False,
+        subset: Optional[Sequence[Any]] = None,
     ) -> Union[tuple[bool, pd.DataFrame], pd.DataFrame]:
         """
         Validate a DataFrame using a Pandera schema and generate a quality report.
@@ -84,6 +118,8 @@ class DataFrameValidator:
         Args:
             schema (Type[DataFrameModel] | DataFrameSchema): The Pandera schema to use for validation.
             df (pd.DataFrame): The DataFrame to validate.
+            subset (Optional[Sequence[Any]]): Optional. The columns to validate. Only the checks of these columns
+                run and only these columns are handed to pandera.
 
         Returns:
             pd.DataFrame: The validated DataFrame with quality columns.
@@ -91,6 +127,154 @@ class DataFrameValidator:
         if not isinstance(schema, pa.DataFrameSchema):
             schema = schema.to_schema()
 
+        schema, columns = self.project(schema, df, subset)
+        data = df[columns] if columns is not None else df
+
+        if self.quality_report:
+            key = self.create_cache_key(schema, data)
+            report, cached = self.create_report(schema, data, key)
+            formatted = cached and report.formatted_issues is not None
+            df = report.with_frame(df).to_frame() if columns is not None else report.to_frame()
+
+            if key and not formatted:
+                self._cache.put(key, self.create_cache_entry(report))
+
+            if validity_flag:
+                return report.is_valid, df
+            return df
+
+        data = schema.validate(data, lazy=self.lazy)
+        df = assign_columns(df, data) if columns is not None else data
+        if validity_flag:
+            return True, df
+        return df
+
+    def report(
+        self,
+        schema: Union[Type[pa.DataFrameModel], pa.DataFrameSchema],
+        df: pd.DataFrame,
+        subset: Optional[Sequence[Any]] = None,
+    ) -> QualityReport:
+        """
+        Validate a DataFrame using a Pandera schema and return a quality report formatting issues on demand.
+
+        Args:
+            schema (Type[DataFrameModel] | DataFrameSchema): The Pandera schema to use for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+            subset (Optional[Sequence[Any]]): Optional. The columns to validate. Only the checks of these columns
+                run and only these columns are handed to pandera.
+
+        Returns:
+            QualityReport: The quality report of the validated DataFrame.
+        """
+        if not isinstance(schema, pa.DataFrameSchema):
+            schema = schema.to_schema()
+
+        schema, columns = self.project(schema, df, subset)
+        data = df[columns] if columns is not None else df
+
+        key = self.create_cache_key(schema, data)
+        report, cached = self.create_report(schema, data, key)
+
+        if key and not cached:
+            self._cache.put(key, self.create_cache_entry(report))
+
+        return report.with_frame(df) if columns is not None else report
+
+    def project(
+        self, schema: pa.DataFrameSchema, df: pd.DataFrame, subset: Optional[Sequence[Any]] = None
+    ) -> tuple[pa.DataFrameSchema, Optional[list[Any]]]:
+        """
+        Project a schema and a DataFrame onto a subset of columns.
+
+        If no subset is given and `project_columns` is set, the subset is inferred from the schema.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema to use for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+            subset (Optional[Sequence[Any]]): Optional. The columns to validate.
+
+        Returns:
+            Tuple[pa.DataFrameSchema, Optional[list[Any]]]: The schema of the subset and the columns of
+                the DataFrame to validate or None, if the complete DataFrame is validated.
+        """
+        if subset is None:
+            return schema, infer_columns(schema, df) if self.project_columns else None
+
+        schema = project_schema(schema, subset)
+        if schema.drop_invalid_rows:
+            return schema, None
+
+        names = set(subset)
+        return schema, [col for col in df.columns if col in names]
+
+    def create_report(
+        self, schema: pa.DataFrameSchema, df: pd.DataFrame, key: Optional[str] = None
+    ) -> tuple[QualityReport, bool]:
+        """
+        Create the quality report of a DataFrame, looking it up in the cache first.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema to use for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+            key (Optional[str]): Optional. The cache key of the validation.
+
+        Returns:
+            Tuple[QualityReport, bool]: The quality report and whether it was taken from the cache.
+        """
+        entry = self._cache.get(key) if key else None
+        if entry is not None:
+            report = QualityReport(
+                df,
+                entry["is_valid"],
+                entry["references"],
+                entry["codes"],
+                entry["labels"],
+                parser=self._parser,
+                columns=self._columns,
+                issues=entry["issues"],
+                status=entry["status"],
+            )
+            return report, True
+
+        if self.deduplicate and self.lazy:
+            report = self.validate_deduplicated(schema, df)
+            if report is not None:
+                return report, False
+
+        return self.validate_frame(schema, df), False
+
+    def validate_frame(self, schema: pa.DataFrameSchema, df: pd.DataFrame) -> QualityReport:
+        """
+        Validate a DataFrame with pandera or the native engine and create its quality report.
+
+        If the index has duplicated labels and the schema does not validate the index,
+        a copy with a RangeIndex is validated, so that failure cases refer to single rows.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema to use for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+
+        Returns:
+            QualityReport: The quality report of the validated DataFrame.
+        """
+        if schema.index is None and not df.index.is_unique:
+            # failure cases reference index labels, which are ambiguous if the index has duplicates
+            report = self.validate_frame(schema, df.reset_index(drop=True))
+            return QualityReport(
+                report.data.set_axis(df.index.take(report.data.index)),
+                report.is_valid,
+                report.references,
+                report.codes,
+                report.labels,
+                failure_cases=report.failure_cases,
+                parser=self._parser,
+                columns=self._columns,
+            )
+
+        if self._engine is not None and self.lazy:
+            return self.validate_native(schema, df)
+
         error: Optional[SchemaError | SchemaErrors] = None
         is_valid = False
 
@@ -102,19 +286,201 @@ class DataFrameValidator:
             df_failure = cast(pd.DataFrame, schema_error.failure_cases)
             error = schema_error
 
-        if not self.quality_report:
-            if error:
-                raise error
+        error = error if isinstance(error, SchemaError) else None
+        return self.create_quality_report(df, df_failure, error, is_valid, schema)
 
-            if validity_flag:
-                return is_valid, df
-            return df
+    def validate_deduplicated(self, schema: pa.DataFrameSchema, df: pd.DataFrame) -> Optional[QualityReport]:
+        """
+        Validate the unique rows of a DataFrame and broadcast their failure cases to all rows.
 
-        error = error if isinstance(error, SchemaError) else None
-        df = self.assign_quality_report(df, df_failure, error)
-        if validity_flag:
-            return is_valid, df
-        return df
+        Row-wise checks run on the unique rows only, while dataframe-wide checks run on all rows.
+        If there are no dataframe-wide failure cases, issues are formatted once per unique row.
+        Like with the native engine, the failure cases of a row are ordered by the position of their check
+        in the schema.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema to use for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+
+        Returns:
+            Optional[QualityReport]: The quality report of the DataFrame or None, if it cannot be deduplicated
+                because it is empty, its values cannot be hashed or the schema transforms the data.
+        """
+        if df.empty or schema_transforms_data(schema):
+            return None
+
+        factorized = factorize_rows(df)
+        if factorized is None:
+            return None
+
+        positions, inverse = factorized
+        row_schema, frame_schema = split_frame_wide_schema(schema)
+        unique_report = self.validate_frame(row_schema, df.take(positions).reset_index(drop=True))
+
+        labels = unique_report.labels
+        order = np.lexsort((rank_labels(schema, labels)[unique_report.codes], unique_report.references))
+        failure_cases = unique_report.failure_cases
+        report = QualityReport(
+            df,
+            unique_report.is_valid,
+            unique_report.references[order],
+            unique_report.codes[order],
+            labels,
+            failure_cases=failure_cases.take(order) if failure_cases is not None else None,
+            parser=self._parser,
+            columns=self._columns,
+            inverse=inverse,
+        )
+        if frame_schema is None:
+            return report
+
+        frame_report = self.validate_frame(frame_schema, df)
+        if frame_report.is_valid:
+            return report
+
+        parts = [part for part in (report, frame_report) if len(part.references)]
+        references, codes, labels = concat_failure_codes(
+            *((part.references, part.codes, part.labels) for part in parts)
+        )
+        order = np.lexsort((rank_labels(schema, labels)[codes], references))
+
+        failure_cases = [part.failure_cases for part in parts]
+        has_failure_cases = bool(parts) and all(cases is not None for cases in failure_cases)
+        return QualityReport(
+            df,
+            False,
+            references[order],
+            codes[order],
+            labels,
+            failure_cases=pd.concat(failure_cases, ignore_index=True).take(order) if has_failure_cases else None,
+            parser=self._parser,
+            columns=self._columns,
+        )
+
+    def validate_native(self, schema: pa.DataFrameSchema, df: pd.DataFrame) -> QualityReport:
+        """
+        Validate a DataFrame by computing built-in checks natively and the remaining schema with pandera.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema to use for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+
+        Returns:
+            QualityReport: The quality report of the validated DataFrame.
+        """
+        engine = cast(NativeCheckEngine, self._engine)
+        residual_schema, native_checks = engine.split_schema(schema)
+
+        try:
+            df = residual_schema.validate(df, lazy=True)
+            df_failure = pd.DataFrame()
+        except SchemaErrors as schema_errors:
+            df_failure = cast(pd.DataFrame, schema_errors.failure_cases)
+
+        number_of_rows = df.shape[0]
+        is_valid = df_failure.empty
+
+        # pandera references index labels, the engine row positions
+        df_failure = self.prepare_failure_cases(df, df_failure, None, number_of_rows)
+        references, codes, labels = concat_failure_codes(
+            failure_cases_to_codes(df_failure), engine.run_checks(df, native_checks, factorize=self.deduplicate)
+        )
+        order = np.lexsort((rank_labels(schema, labels)[codes], references))
+
+        is_valid = is_valid and not len(codes)
+        return QualityReport(
+            df, is_valid, references[order], codes[order], labels, parser=self._parser, columns=self._columns
+        )
+
+    def create_cache_key(self, schema: pa.DataFrameSchema, df: pd.DataFrame) -> Optional[str]:
+        """
+        Create the cache key for validating a DataFrame against a schema.
+
+        Args:
+            schema (pa.DataFrameSchema): The Pandera schema to use for validation.
+            df (pd.DataFrame): The DataFrame to validate.
+
+        Returns:
+            Optional[str]: The cache key or None, if no cache is used or the result cannot be cached.
+        """
+        if self._cache is None:
+            return None
+
+        # the parser's and engine's instance state, e.g. separators or custom check functions, is fingerprinted
+        parser = type(self._parser)
+        status = [getattr(self._parser, name, None) for name in ("valid_status", "invalid_status", "none_status")]
+        return self._cache.make_key(
+            schema,
+            df,
+            self.lazy,
+            f"{parser.__module__}.{parser.__qualname__}",
+            status,
+            self._parser,
+            self._engine,
+            self.deduplicate,
+        )
+
+    def create_cache_entry(self, report: QualityReport) -> CacheEntry:
+        """
+        Create the cache entry of a quality report, including its issues and status if already formatted.
+
+        Args:
+            report (QualityReport): The quality report.
+
+        Returns:
+            CacheEntry: The cache entry.
+        """
+        return {
+            "is_valid": report.is_valid,
+            "references": report.references,
+            "codes": report.codes,
+            "labels": report.labels,
+            "issues": report.formatted_issues,
+            "status": report.formatted_status,
+        }
+
+    def create_quality_report(
+        self,
+        df: pd.DataFrame,
+        df_failure: pd.DataFrame,
+        error: Optional[SchemaError],
+        is_valid: bool,
+        schema: Optional[pa.DataFrameSchema] = None,
+    ) -> QualityReport:
+        """
+        Create a quality report of the DataFrame based on failure cases.
+
+        Args:
+            df (pd.DataFrame): The validated DataFrame.
+            df_failure (pd.DataFrame): The DataFrame containing failure cases.
+            error (Optional[SchemaError]): Optional. The schema validation error.
+            is_valid (bool): Whether the DataFrame is valid.
+            schema (Optional[pa.DataFrameSchema]): Optional. The Pandera schema used for validation.
+                If provided, the failure cases of a row are ordered by the position of their check in the schema,
+                otherwise they are kept in pandera's order.
+
+        Returns:
+            QualityReport: The quality report of the DataFrame.
+        """
+        number_of_rows = df.shape[0]
+
+        df_failure = self.prepare_failure_cases(df, df_failure, error, number_of_rows).reset_index(drop=True)
+        references, codes, labels = failure_cases_to_codes(df_failure)
+
+        if schema is not None and len(codes):
+            order = np.lexsort((rank_labels(schema, labels)[codes], references))
+            references, codes, df_failure = references[order], codes[order], df_failure.take(order)
+
+        return QualityReport(
+            df,
+            is_valid,
+            references,
+            codes,
+            labels,
+            failure_cases=df_failure if not df_failure.empty else None,
+            parser=self._parser,
+            columns=self._columns,
+        )
 
     def assign_quality_report(
         self, df: pd.DataFrame, df_failure: pd.DataFrame, error: Optional[SchemaError]
@@ -130,17 +496,74 @@ class DataFrameValidator:
         Returns:
             pd.DataFrame: The DataFrame with quality report columns.
         """
-        number_of_rows = df.shape[0] or 1
+        return self.create_quality_report(df, df_failure, error, df_failure.empty).to_frame()
 
-        if not df_failure.empty:
-            if df.empty:
-                df_failure = df_failure[df_failure["schema_context"].str.lower() != "column"]
-            df_failure = self.validate_failure_case_dataframe(df_failure, error)
-            df_failure = self.transform_failure_cases_dataframe(df_failure, number_of_rows)
+    def prepare_failure_cases(
+        self, df: pd.DataFrame, df_failure: pd.DataFrame, error: Optional[SchemaError], number_of_rows: int
+    ) -> pd.DataFrame:
+        """
+        Prepare the failure cases for parsing, assigning every failure case to the rows it applies to.
 
-        series_issues, series_status = self._parser.parse_failure_cases(df_failure, number_of_rows)
+        Args:
+            df (pd.DataFrame): The validated DataFrame.
+            df_failure (pd.DataFrame): The DataFrame containing failure cases.
+            error (Optional[SchemaError]): Optional. The schema validation error.
+            number_of_rows (int): The number of rows of the quality report.
+
+        Returns:
+            pd.DataFrame: The failure cases with one row position per failure case.
+        """
+        if df_failure.empty:
+            return df_failure
+
+        if df.empty:
+            df_failure = df_failure[df_failure["schema_context"].str.lower() != "column"]
+        df_failure = self.validate_failure_case_dataframe(df_failure, error)
+        df_failure = self.locate_failure_cases(df_failure, df.index, error)
+        return self.transform_failure_cases_dataframe(df_failure, number_of_rows)
+
+    def locate_failure_cases(
+        self, df_failure: pd.DataFrame, index: pd.Index, error: Optional[SchemaError] = None
+    ) -> pd.DataFrame:
+        """
+        Replace the index labels of row-based failure cases with the positions of the rows.
 
-        return df.assign(**{self._col_issues: series_issues, self._col_status: series_status})
+        Failure cases of an index component already reference row positions and are kept as they are.
+        A failure case of a label which occurs multiple times in the index applies to all rows with that label,
+        each failure label is only kept once per row.
+
+        Args:
+            df_failure (pd.DataFrame): The DataFrame containing failure cases with index labels as reference.
+            index (pd.Index): The index of the validated DataFrame.
+            error (Optional[SchemaError]): Optional. The schema validation error.
+
+        Returns:
+            pd.DataFrame: The failure cases with row positions as reference.
+
+        Raises:
+            ValueError: If a reference is not a label of the index.
+        """
+        if "schema_context" in df_failure.columns:
+            is_position = df_failure["schema_context"].str.lower() == "index"
+        else:
+            is_position = pd.Series(isinstance(error.schema, pa.Index) if error else False, index=df_failure.index)
+
+        mask = df_failure["reference"].notna() & ~is_position
+        if not mask.any():
+            return df_failure
+
+        df_failure_rows = df_failure[mask]
+        index_codes, uniques = pd.factorize(index)
+        label_codes = pd.Index(uniques).get_indexer(df_failure_rows["reference"])
+        if (label_codes < 0).any():
+            missing = df_failure_rows["reference"][label_codes < 0].unique().tolist()
+            raise ValueError(f"Failure case references {missing} are not in the index of the DataFrame.")
+
+        positions, take = broadcast_failure_codes(label_codes.astype(np.int64), index_codes.astype(np.int64))
+        df_failure_rows = df_failure_rows.iloc[take].assign(reference=positions)
+        if len(uniques) < len(index):
+            df_failure_rows = df_failure_rows.drop_duplicates(["reference", "column", "check"])
+        return pd.concat([df_failure[~mask], df_failure_rows])
 
     def validate_failure_case_dataframe(self, df_failure: pd.DataFrame, error: Optional[SchemaError]) -> pd.DataFrame:
         """
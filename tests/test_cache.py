@@ -0,0 +1,191 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from pandera_report.cache import (
+    frame_fingerprint,
+    schema_fingerprint,
+    schema_transforms_data,
+    ValidationCache,
+)
+from pandera_report.engine import NATIVE_CHECKS, NativeCheckEngine
+from pandera_report.parser import DefaultFailureCaseParser
+from pandera_report.validator import DataFrameValidator
+
+
+def create_schema(max_value: int = 10) -> pa.DataFrameSchema:
+    return pa.DataFrameSchema(
+        {
+            "column1": pa.Column(int, checks=pa.Check.le(max_value)),
+            "column2": pa.Column(float, checks=pa.Check.lt(-1.2)),
+            "column3": pa.Column(
+                str,
+                checks=[
+                    pa.Check.str_startswith("value_"),
+                    pa.Check(lambda s: s.str.split("_", expand=True).shape[1] == 2),
+                ],
+            ),
+        }
+    )
+
+
+schema = create_schema()
+
+LIMIT = 10
+
+
+def test_schema_fingerprint_globals(monkeypatch):
+    global_schema = pa.DataFrameSchema({"column1": pa.Column(int, checks=pa.Check(lambda s: s <= LIMIT))})
+    fingerprint = schema_fingerprint(global_schema)
+
+    monkeypatch.setattr(f"{__name__}.LIMIT", 11)
+
+    assert schema_fingerprint(global_schema) != fingerprint
+
+
+def test_schema_fingerprint():
+    other_function = schema.update_column("column3", checks=pa.Check(lambda s: s.str.len() > 2))
+
+    assert schema_fingerprint(schema) == schema_fingerprint(create_schema())
+    assert schema_fingerprint(schema) != schema_fingerprint(create_schema(11))
+    assert schema_fingerprint(schema) != schema_fingerprint(other_function)
+
+
+def test_frame_fingerprint(df_valid, df_invalid_values):
+    assert frame_fingerprint(df_valid) == frame_fingerprint(df_valid.copy())
+    assert frame_fingerprint(df_valid) != frame_fingerprint(df_invalid_values)
+    assert frame_fingerprint(df_valid) != frame_fingerprint(df_valid.astype({"column1": float}))
+    assert frame_fingerprint(pd.DataFrame({"column1": [[1], [2]]})) is None
+    assert frame_fingerprint(pd.DataFrame({"column1": [1, 2]}, dtype=object)) != frame_fingerprint(
+        pd.DataFrame({"column1": ["1", "2"]}, dtype=object)
+    )
+    assert frame_fingerprint(pd.DataFrame({"column1": [1, "2"]}, dtype=object)) is None
+
+
+def test_frame_fingerprint_labels():
+    def categorical(categories: list) -> pd.DataFrame:
+        return pd.DataFrame({"column1": pd.Categorical(["a"], categories=categories)})
+
+    assert frame_fingerprint(pd.DataFrame({1: [1]})) != frame_fingerprint(pd.DataFrame({"1": [1]}))
+    assert frame_fingerprint(categorical(["a", "b"])) != frame_fingerprint(categorical(["a", "c"]))
+    assert frame_fingerprint(pd.DataFrame({"column1": [1]}, index=pd.Index([0], name="id"))) != frame_fingerprint(
+        pd.DataFrame({"column1": [1]}, index=pd.Index([0], name="other"))
+    )
+
+
+def test_schema_transforms_data():
+    assert not schema_transforms_data(schema)
+    assert schema_transforms_data(schema.update_column("column1", coerce=True))
+    assert schema_transforms_data(schema.update_column("column1", drop_invalid_rows=True))
+    assert schema_transforms_data(pa.DataFrameSchema(schema.columns, strict="filter"))
+    assert schema_transforms_data(pa.DataFrameSchema(schema.columns, index=pa.Index(float, coerce=True)))
+    assert schema_transforms_data(
+        pa.DataFrameSchema(schema.columns, index=pa.MultiIndex([pa.Index(int), pa.Index(float, coerce=True)]))
+    )
+    assert not schema_transforms_data(pa.DataFrameSchema(schema.columns, index=pa.Index(int)))
+
+
+def test_validation_cache_validator(df_invalid_values):
+    cache = ValidationCache()
+    validator = DataFrameValidator(cache=cache)
+
+    is_valid_miss, df_miss = validator.validate(schema, df_invalid_values, validity_flag=True)
+    is_valid_hit, df_hit = validator.validate(schema, df_invalid_values.copy(), validity_flag=True)
+
+    assert not is_valid_miss and not is_valid_hit
+    pd.testing.assert_frame_equal(df_miss, df_hit)
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["entries"] == 1
+
+
+def test_validation_cache_eviction():
+    entry = {
+        "is_valid": False,
+        "references": np.arange(10),
+        "codes": np.zeros(10, dtype=np.int64),
+        "labels": pd.DataFrame({"column": ["column1"], "check": ["less_than_or_equal_to(10)"]}),
+        "issues": np.array(["issue"] * 10, dtype=object),
+        "status": np.array(["Invalid"] * 10, dtype=object),
+    }
+    cache = ValidationCache(max_bytes=1)
+    cache.put("key", entry)
+
+    assert cache.get("key") is None
+    assert cache.stats["entries"] == 0
+
+    cache = ValidationCache()
+    cache.put("key1", entry)
+    cache.max_bytes = cache.stats["size"] * 2
+    cache.put("key2", entry)
+    cache.get("key1")
+    cache.put("key3", entry)
+
+    assert cache.get("key1") is not None
+    assert cache.get("key2") is None
+    assert cache.stats["evictions"] == 1
+
+
+def test_validation_cache_disk(tmp_path: Path, df_invalid_values):
+    DataFrameValidator(cache=ValidationCache(directory=tmp_path)).validate(schema, df_invalid_values)
+
+    cache = ValidationCache(directory=tmp_path)
+    df = DataFrameValidator(cache=cache).validate(schema, df_invalid_values)
+
+    assert cache.stats["disk_hits"] == 1
+    assert df["quality_status"].to_list() == ["Invalid", "Valid", "Valid", "Valid", "Invalid"]
+
+    cache.clear()
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_validation_cache_disk_errors(tmp_path: Path, df_invalid_values):
+    cache = ValidationCache(directory=tmp_path / "cache")
+    validator = DataFrameValidator(cache=cache)
+    key = validator.create_cache_key(schema, df_invalid_values)
+
+    (tmp_path / "cache" / f"{key}.pkl").write_bytes(b"cmissing_module\nmissing\n.")
+    assert cache.get(key) is None
+
+    (tmp_path / "cache" / f"{key}.pkl").unlink()
+    (tmp_path / "cache").rmdir()
+    df = validator.validate(schema, df_invalid_values)
+
+    assert df["quality_status"].to_list() == ["Invalid", "Valid", "Valid", "Valid", "Invalid"]
+    assert cache.stats["entries"] == 1
+
+
+def test_validation_cache_report(df_invalid_values):
+    cache = ValidationCache()
+    validator = DataFrameValidator(cache=cache)
+
+    report = validator.report(schema, df_invalid_values)
+    assert cache.get(validator.create_cache_key(schema, df_invalid_values))["issues"] is None
+
+    df = validator.validate(schema, df_invalid_values)
+    assert cache.get(validator.create_cache_key(schema, df_invalid_values))["issues"] is not None
+
+    report_hit = validator.report(schema, df_invalid_values)
+    pd.testing.assert_frame_equal(report.to_frame(), df)
+    pd.testing.assert_frame_equal(report_hit.to_frame(), df)
+
+
+def test_validation_cache_key_instances(df_invalid_values):
+    cache = ValidationCache()
+    separator_parser = DefaultFailureCaseParser()
+    separator_parser.separator = ", "
+    custom_engine = NativeCheckEngine(checks={**NATIVE_CHECKS, "less_than": lambda series, statistics: series > 0})
+
+    keys = {
+        DataFrameValidator(cache=cache).create_cache_key(schema, df_invalid_values),
+        DataFrameValidator(cache=cache, parser=separator_parser).create_cache_key(schema, df_invalid_values),
+        DataFrameValidator(cache=cache, engine=NativeCheckEngine()).create_cache_key(schema, df_invalid_values),
+        DataFrameValidator(cache=cache, engine=custom_engine).create_cache_key(schema, df_invalid_values),
+    }
+
+    key = DataFrameValidator(cache=cache, engine=NativeCheckEngine()).create_cache_key(schema, df_invalid_values)
+
+    assert len(keys) == 4
+    assert key in keys
@@ -0,0 +1,159 @@
+import json
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pandera as pa
+import pytest
+from pandera.typing import Series
+
+from pandera_report.cli import (
+    expand_paths,
+    load_schema,
+    main,
+    read_chunks,
+    run,
+)
+
+
+class CliSchemaModel(pa.DataFrameModel):
+    column1: Series[int] = pa.Field(le=10)
+    column2: Series[float] = pa.Field(lt=-1.2)
+    column3: Series[str] = pa.Field(str_startswith="value_")
+
+
+@pytest.fixture()
+def input_dir(tmp_path: Path, df_valid: pd.DataFrame, df_invalid_values: pd.DataFrame) -> Path:
+    directory = tmp_path / "inputs"
+    directory.mkdir()
+    df_valid.to_csv(directory / "valid.csv", index=False)
+    df_invalid_values.to_csv(directory / "invalid.csv", index=False)
+    return directory
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "test_cli:CliSchemaModel",
+        "test_cli.CliSchemaModel",
+    ],
+)
+def test_cli_load_schema(spec: str):
+    schema = load_schema(spec)
+
+    assert isinstance(schema, pa.DataFrameSchema)
+    assert list(schema.columns) == ["column1", "column2", "column3"]
+
+
+def test_cli_load_schema_yaml(tmp_path: Path):
+    pytest.importorskip("pandera.io")
+    path = tmp_path / "schema.yaml"
+    path.write_text(CliSchemaModel.to_schema().to_yaml(), encoding="utf-8")
+
+    schema = load_schema(str(path))
+
+    assert list(schema.columns) == ["column1", "column2", "column3"]
+
+
+def test_cli_load_schema_invalid():
+    with pytest.raises(ValueError):
+        load_schema("CliSchemaModel")
+
+
+def test_cli_read_chunks(input_dir: Path):
+    chunks = list(read_chunks(input_dir / "valid.csv", chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(chunk.index.to_list() == list(range(len(chunk))) for chunk in chunks)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cli_run(input_dir: Path, tmp_path: Path, workers: int):
+    output_dir = tmp_path / "outputs"
+    paths = expand_paths([str(input_dir / "*.csv")])
+
+    summary = run("test_cli:CliSchemaModel", paths, output_dir, chunksize=2, workers=workers)
+
+    files = {Path(file["input"]).name: file for file in summary["files"]}
+    assert summary["rows"] == 10
+    assert summary["invalid_rows"] == 2
+    assert files["valid.csv"]["is_valid"]
+    assert files["valid.csv"]["chunks"] == 3
+    assert not files["invalid.csv"]["is_valid"]
+    assert files["invalid.csv"]["error"] is None
+
+    df = pd.read_csv(output_dir / "invalid.csv")
+    assert df["quality_status"].to_list() == ["Invalid", "Valid", "Valid", "Valid", "Invalid"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cli_run_nested(input_dir: Path, tmp_path: Path, workers: int):
+    for name in ("a", "b"):
+        (input_dir / name).mkdir(exist_ok=True)
+        shutil.copy(input_dir / "invalid.csv", input_dir / name / "orders.csv")
+    output_dir = tmp_path / "outputs"
+    paths = expand_paths([str(input_dir / "**" / "orders.csv")])
+
+    summary = run("test_cli:CliSchemaModel", paths, output_dir, workers=workers)
+
+    assert [file["output"] for file in summary["files"]] == [
+        str(output_dir / "a" / "orders.csv"),
+        str(output_dir / "b" / "orders.csv"),
+    ]
+    assert all((output_dir / name / "orders.csv").is_file() for name in ("a", "b"))
+
+
+def test_cli_main(input_dir: Path, tmp_path: Path):
+    output_dir = tmp_path / "outputs"
+    argv = ["test_cli:CliSchemaModel", str(input_dir / "*.csv"), "-o", str(output_dir), "-w", "1"]
+
+    assert main(argv) == 0
+    assert main([*argv, "--native"]) == 0
+    assert main([*argv, "--deduplicate", "--project-columns"]) == 0
+    assert main([*argv, "--fail-on-invalid"]) == 1
+
+    summary = json.loads((output_dir / "summary.json").read_text(encoding="utf-8"))
+    assert summary["invalid_rows"] == 2
+
+
+def test_cli_main_errors(input_dir: Path, tmp_path: Path):
+    assert main(["test_cli:CliSchemaModel", str(tmp_path / "missing" / "*.csv")]) == 1
+    assert main(["test_cli:MissingModel", str(input_dir / "*.csv"), "-s", str(tmp_path / "summary.json")]) == 1
+
+
+def test_cli_run_parquet(df_invalid_values: pd.DataFrame, tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "invalid.parquet"
+    df_invalid_values.to_parquet(path, index=False)
+
+    summary = run("test_cli:CliSchemaModel", [path], tmp_path / "outputs", chunksize=2, workers=1)
+
+    df = pd.read_parquet(tmp_path / "outputs" / "invalid.parquet")
+    assert summary["invalid_rows"] == 2
+    assert df["quality_status"].to_list() == ["Invalid", "Valid", "Valid", "Valid", "Invalid"]
+
+
+class NullableSchemaModel(pa.DataFrameModel):
+    column1: Series[float] = pa.Field(nullable=True, le=10)
+    column2: Series[str]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_cli_run_chunk_dtypes(tmp_path: Path, suffix: str):
+    pyarrow = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / f"nullable{suffix}"
+    if suffix == ".csv":
+        pd.DataFrame({"column1": [1, 2, 3, None, 11], "column2": ["a", "b", "c", "d", "e"]}).to_csv(path, index=False)
+    else:
+        table = pyarrow.table(
+            {"column1": pyarrow.array([1, 2, 3, None, 11], pyarrow.int64()), "column2": ["a", "b", "c", "d", "e"]}
+        )
+        parquet.write_table(table, path)
+
+    summary = run("test_cli:NullableSchemaModel", [path], workers=1)
+    summary_chunked = run("test_cli:NullableSchemaModel", [path], chunksize=2, workers=1)
+
+    assert summary["invalid_rows"] == summary_chunked["invalid_rows"] == 1
+    assert summary["files"][0]["is_valid"] == summary_chunked["files"][0]["is_valid"]
+    assert [len(chunk) for chunk in read_chunks(path, chunksize=2)] == [2, 2, 1]
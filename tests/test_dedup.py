@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from pandera_report.dedup import (
+    broadcast_failure_codes,
+    factorize_rows,
+    is_row_wise_check,
+    split_frame_wide_schema,
+)
+from pandera_report.engine import NativeCheckEngine
+from pandera_report.parser import DefaultFailureCaseParser
+from pandera_report.validator import DataFrameValidator
+
+row_wise_schema = pa.DataFrameSchema(
+    {
+        "column1": pa.Column(int, checks=pa.Check.le(10)),
+        "column2": pa.Column(float, checks=pa.Check.lt(-1.2)),
+        "column3": pa.Column(
+            str, checks=[pa.Check.str_startswith("value_"), pa.Check(lambda x: x != "", element_wise=True)]
+        ),
+    }
+)
+
+frame_wide_schema = pa.DataFrameSchema(
+    {
+        "column1": pa.Column(int, checks=pa.Check.le(10), unique=True),
+        "column2": pa.Column(float, checks=pa.Check.lt(-1.2)),
+        "column3": pa.Column(
+            str,
+            checks=[pa.Check.str_startswith("value_"), pa.Check(lambda s: s.str.len() <= s.str.len().median())],
+        ),
+    },
+    checks=pa.Check(lambda df: df["column1"] < df.shape[0] + 5),
+    unique=["column2", "column3"],
+)
+
+
+@pytest.fixture(scope="module")
+def df_repeated(df_invalid_values: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat([df_invalid_values] * 3, ignore_index=True)
+
+
+@pytest.mark.parametrize("schema", [row_wise_schema, frame_wide_schema])
+@pytest.mark.parametrize("engine", [None, NativeCheckEngine()])
+@pytest.mark.parametrize(
+    "df_fixture", ["df_valid", "df_invalid_values", "df_invalid_column", "df_repeated", "df_empty"]
+)
+def test_deduplicated_matches_pandera(schema: pa.DataFrameSchema, engine, df_fixture: str, request):
+    df = request.getfixturevalue(df_fixture)
+
+    is_valid, df_pandera = DataFrameValidator().validate(schema, df, validity_flag=True)
+    is_valid_dedup, df_dedup = DataFrameValidator(engine=engine, deduplicate=True).validate(
+        schema, df, validity_flag=True
+    )
+
+    assert is_valid == is_valid_dedup
+    assert df_pandera["quality_status"].to_list() == df_dedup["quality_status"].to_list()
+    pd.testing.assert_frame_equal(df_pandera, df_dedup)
+
+
+def test_deduplicated_formats_unique_rows(df_repeated: pd.DataFrame):
+    class CountingParser(DefaultFailureCaseParser):
+        rows = 0
+
+        def join_failure_codes(self, references, cases, number_of_rows):
+            CountingParser.rows += number_of_rows
+            return super().join_failure_codes(references, cases, number_of_rows)
+
+    report = DataFrameValidator(parser=CountingParser(), deduplicate=True).report(row_wise_schema, df_repeated)
+
+    assert report.invalid_rows == 6
+    assert report[5] == "Column <column1>: less_than_or_equal_to(10)"
+    assert report.issues(slice(3, 6)).to_list() == report.issues().to_list()[3:6]
+    assert CountingParser.rows == 1 + 3 + 5
+    assert report.to_failure_cases()["reference"].to_list() == [0, 5, 10, 4, 9, 14]
+
+
+def test_deduplicated_uniqueness():
+    df = pd.DataFrame({"column1": [1, 2, 1, 1], "column2": ["a", "b", "a", "c"]})
+    schema = pa.DataFrameSchema({"column1": pa.Column(int, unique=True), "column2": pa.Column(str, pa.Check.ne("c"))})
+
+    df_dedup = DataFrameValidator(deduplicate=True).validate(schema, df)
+
+    assert df_dedup["quality_issues"].to_list() == [
+        "Column <column1>: field_uniqueness",
+        "None",
+        "Column <column1>: field_uniqueness",
+        "Column <column1>: field_uniqueness | Column <column2>: not_equal_to(c)",
+    ]
+
+
+def test_deduplicated_unhashable_values():
+    df = pd.DataFrame({"column1": [[1], [1], [2]]})
+    schema = pa.DataFrameSchema({"column1": pa.Column(checks=pa.Check(lambda x: len(x) == 1, element_wise=True))})
+
+    assert DataFrameValidator(deduplicate=True).validate(schema, df)["quality_status"].to_list() == ["Valid"] * 3
+
+
+def test_deduplicated_mixed_types():
+    df = pd.DataFrame({"column1": [1, 1.0, True, "1"]}, dtype=object)
+    schema = pa.DataFrameSchema({"column1": pa.Column(checks=pa.Check(lambda x: type(x) is int, element_wise=True))})
+
+    df_dedup = DataFrameValidator(deduplicate=True).validate(schema, df)
+
+    assert df_dedup["quality_status"].to_list() == ["Valid", "Invalid", "Invalid", "Invalid"]
+
+
+def test_factorize_rows():
+    df = pd.DataFrame({"column1": [1, 2, 1, None, None], "column2": ["a", "a", "a", "b", "b"]})
+
+    positions, inverse = factorize_rows(df)
+
+    np.testing.assert_array_equal(positions, [0, 1, 3])
+    np.testing.assert_array_equal(inverse, [0, 1, 0, 2, 2])
+
+
+def test_broadcast_failure_codes():
+    rows, take = broadcast_failure_codes(np.array([2, 0, 2]), np.array([0, 1, 0, 2, 2]))
+
+    np.testing.assert_array_equal(rows, [3, 4, 0, 2, 3, 4])
+    np.testing.assert_array_equal(take, [0, 0, 1, 1, 2, 2])
+
+
+def test_split_frame_wide_schema():
+    row_schema, frame_schema = split_frame_wide_schema(frame_wide_schema)
+
+    assert [len(column.checks) for column in row_schema.columns.values()] == [1, 1, 1]
+    assert not row_schema.checks and row_schema.unique is None
+    assert list(frame_schema.columns) == ["column1", "column3"]
+    assert frame_schema.unique == ["column2", "column3"]
+    assert split_frame_wide_schema(row_wise_schema)[1] is None
+    assert not is_row_wise_check(pa.Check.unique_values_eq([1]))
+
+
+def test_native_engine_factorize(df_repeated: pd.DataFrame):
+    engine = NativeCheckEngine()
+    _, native = engine.split_schema(row_wise_schema)
+
+    references, codes, labels = engine.run_checks(df_repeated, native, factorize=True)
+    expected_references, expected_codes, expected_labels = engine.run_checks(df_repeated, native)
+
+    np.testing.assert_array_equal(references, expected_references)
+    np.testing.assert_array_equal(codes, expected_codes)
+    pd.testing.assert_frame_equal(labels, expected_labels)
+
+
+def test_deduplicated_strict_filter():
+    df = pd.DataFrame({"column1": [1, 1], "extra": ["a", "a"]})
+    schema = pa.DataFrameSchema({"column1": pa.Column(int)}, strict="filter")
+
+    df_dedup = DataFrameValidator(deduplicate=True).validate(schema, df)
+
+    assert list(df_dedup.columns) == ["column1", "quality_issues", "quality_status"]
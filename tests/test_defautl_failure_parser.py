@@ -1,3 +1,5 @@
+import numpy as np
+
 from pandera_report.parser import DefaultFailureCaseParser
 
 
@@ -62,3 +64,30 @@ def test_default_failure_case_parser_invalid_dataframe_columns(df_invalid_column
             "Invalid",
         ]
     ).all()
+
+
+def test_default_failure_case_parser_failure_codes(df_invalid_column, df_invalid_column_failure):
+    parser = DefaultFailureCaseParser()
+    labels = df_invalid_column_failure[["column", "check"]].drop_duplicates().reset_index(drop=True)
+    codes = df_invalid_column_failure["check"].map({check: code for code, check in enumerate(labels["check"])})
+
+    series_issues, series_status = parser.parse_failure_codes(
+        df_invalid_column_failure["reference"].to_numpy(), codes.to_numpy(), labels, len(df_invalid_column)
+    )
+    expected_issues, expected_status = parser.parse_failure_cases(df_invalid_column_failure, len(df_invalid_column))
+
+    assert (series_issues == expected_issues).all()
+    assert (series_status == expected_status).all()
+
+
+def test_custom_failure_case_parser_failure_codes(df_invalid_values, df_invalid_values_failure):
+    class CountingParser(DefaultFailureCaseParser):
+        def create_quality_issues(self, df):
+            return f"{len(df)} issue(s)"
+
+    labels = df_invalid_values_failure[["column", "check"]].reset_index(drop=True)
+    series_issues, _ = CountingParser().parse_failure_codes(
+        df_invalid_values_failure["reference"].to_numpy(), np.arange(2), labels, len(df_invalid_values)
+    )
+
+    assert series_issues.to_list() == ["1 issue(s)", "None", "None", "None", "1 issue(s)"]
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from pandera_report.engine import (
+    concat_failure_codes,
+    failure_cases_to_codes,
+    NativeCheckEngine,
+    rank_labels,
+)
+from pandera_report.validator import DataFrameValidator
+
+builtin_schema = pa.DataFrameSchema(
+    {
+        "column1": pa.Column(int, checks=[pa.Check.le(10), pa.Check.in_range(1, 10)]),
+        "column2": pa.Column(float, checks=pa.Check.lt(-1.2)),
+        "column3": pa.Column(
+            str,
+            checks=[pa.Check.str_startswith("value_"), pa.Check.isin(["value_1", "value_2"]), pa.Check.notin(["x"])],
+        ),
+    }
+)
+
+custom_schema = pa.DataFrameSchema(
+    {
+        "column1": pa.Column(int, checks=pa.Check.le(10)),
+        "column2": pa.Column(float, checks=pa.Check.lt(-1.2)),
+        "column3": pa.Column(
+            str,
+            checks=[
+                pa.Check.str_startswith("value_"),
+                pa.Check(lambda s: s.str.split("_", expand=True).shape[1] == 2),
+            ],
+        ),
+    }
+)
+
+
+@pytest.mark.parametrize("schema", [builtin_schema, custom_schema])
+@pytest.mark.parametrize("df_fixture", ["df_valid", "df_invalid_values", "df_invalid_column", "df_empty"])
+def test_native_engine_matches_pandera(schema: pa.DataFrameSchema, df_fixture: str, request):
+    df = request.getfixturevalue(df_fixture)
+
+    is_valid, df_pandera = DataFrameValidator().validate(schema, df, validity_flag=True)
+    is_valid_native, df_native = DataFrameValidator(engine=NativeCheckEngine()).validate(schema, df, validity_flag=True)
+
+    assert is_valid == is_valid_native
+    pd.testing.assert_frame_equal(df_pandera, df_native)
+
+
+def test_native_engine_nullable():
+    df = pd.DataFrame({"column1": [1.0, None, 20.0]})
+    schema = pa.DataFrameSchema({"column1": pa.Column(float, checks=pa.Check.le(10))})
+
+    df_native = DataFrameValidator(engine=NativeCheckEngine()).validate(schema, df)
+
+    assert df_native["quality_issues"].to_list() == [
+        "None",
+        "Column <column1>: not_nullable",
+        "Column <column1>: less_than_or_equal_to(10)",
+    ]
+
+
+def test_native_engine_type_error():
+    df = pd.DataFrame({"column1": ["a", "b"]})
+    schema = pa.DataFrameSchema({"column1": pa.Column(checks=pa.Check.le(10))})
+
+    df_native = DataFrameValidator(engine=NativeCheckEngine()).validate(schema, df)
+
+    assert (df_native["quality_issues"] == "Column <column1>: less_than_or_equal_to(10)").all()
+
+
+def test_native_engine_split_schema():
+    engine = NativeCheckEngine()
+    schema = custom_schema.update_column("column2", coerce=True)
+
+    residual, native = engine.split_schema(schema)
+
+    assert list(native) == ["column1", "column3"]
+    assert [check.name for check in native["column3"][1]] == ["str_startswith"]
+    assert [check.name for check in residual.columns["column3"].checks] == ["<lambda>"]
+    assert residual.columns["column2"].checks == schema.columns["column2"].checks
+    assert not engine.is_native_check(pa.Check(lambda s: s > 0, name="isin"))
+    assert not engine.is_native_check(pa.Check.le(10, raise_warning=True))
+
+
+def test_failure_codes():
+    df_failure = pd.DataFrame(
+        {
+            "reference": [0, 4, 2],
+            "column": ["column1", "column3", "column1"],
+            "check": ["less_than_or_equal_to(10)", "str_startswith('value_')", "less_than_or_equal_to(10)"],
+        }
+    )
+
+    references, codes, labels = concat_failure_codes(
+        failure_cases_to_codes(df_failure), failure_cases_to_codes(df_failure.iloc[:1])
+    )
+
+    assert references.tolist() == [0, 4, 2, 0]
+    assert codes.tolist() == [0, 1, 0, 2]
+    assert labels["column"].to_list() == ["column1", "column3", "column1"]
+    assert rank_labels(custom_schema, labels).tolist() == [0, 2, 1]
+    assert rank_labels(custom_schema, pd.DataFrame({"column": ["column2"], "check": ["dtype"]})).tolist() == [0]
+    assert len(concat_failure_codes()[0]) == 0
+    assert np.array_equal(failure_cases_to_codes(pd.DataFrame())[0], [])
+
+
+@pytest.mark.parametrize("index", [[2, 1, 0], [10, 20, 30]])
+def test_native_engine_index_labels(index: list):
+    df = pd.DataFrame({"a": [1, 4, 6]}, index=index)
+    schema = pa.DataFrameSchema({"a": pa.Column(int, checks=[pa.Check.le(3), pa.Check(lambda s: s > 1)])})
+
+    df_native = DataFrameValidator(engine=NativeCheckEngine()).validate(schema, df)
+
+    assert df_native.index.to_list() == index
+    assert df_native["quality_issues"].to_list() == [
+        "Column <a>: <lambda>",
+        "Column <a>: less_than_or_equal_to(3)",
+        "Column <a>: less_than_or_equal_to(3)",
+    ]
+
+
+@pytest.mark.parametrize("engine", [None, NativeCheckEngine()])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_issues_ordered_by_schema(engine, deduplicate: bool):
+    df = pd.DataFrame({"a": [1, 2, 3, 4] * 5, "b": ["x", "y", "x", "z"] * 5, "c": [1, 1, 2, 3] * 5})
+    schema = pa.DataFrameSchema(
+        {
+            "a": pa.Column(int, pa.Check.le(2)),
+            "b": pa.Column(str, pa.Check.str_startswith("x")),
+            "c": pa.Column(int, unique=True),
+        }
+    )
+
+    df_validated = DataFrameValidator(engine=engine, deduplicate=deduplicate).validate(schema, df)
+
+    assert df_validated["quality_issues"].to_list()[:4] == [
+        "Column <c>: field_uniqueness",
+        "Column <b>: str_startswith('x') | Column <c>: field_uniqueness",
+        "Column <a>: less_than_or_equal_to(2) | Column <c>: field_uniqueness",
+        "Column <a>: less_than_or_equal_to(2) | Column <b>: str_startswith('x') | Column <c>: field_uniqueness",
+    ]
+    assert df_validated["quality_issues"].to_list()[:4] * 5 == df_validated["quality_issues"].to_list()
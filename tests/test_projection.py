@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from pandera_report.projection import infer_columns, project_schema
+from pandera_report.validator import DataFrameValidator
+
+schema = pa.DataFrameSchema(
+    {
+        "column1": pa.Column(int, checks=pa.Check.le(10)),
+        "column2": pa.Column(float, checks=pa.Check.lt(-1.2)),
+        "column3": pa.Column(str, checks=pa.Check.str_startswith("value_")),
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def df_wide(df_invalid_values: pd.DataFrame) -> pd.DataFrame:
+    extra = pd.DataFrame(np.arange(50).reshape(5, 10), columns=[f"extra{i}" for i in range(10)])
+    return pd.concat([extra.iloc[:, :5], df_invalid_values, extra.iloc[:, 5:]], axis=1)
+
+
+def test_project_columns(df_wide: pd.DataFrame, df_invalid_values: pd.DataFrame):
+    df_expected = DataFrameValidator().validate(schema, df_invalid_values)
+    df_projected = DataFrameValidator(project_columns=True).validate(schema, df_wide)
+
+    assert list(df_projected.columns) == [*df_wide.columns, "quality_issues", "quality_status"]
+    pd.testing.assert_frame_equal(df_projected[df_expected.columns], df_expected)
+    assert np.shares_memory(df_projected["extra0"].to_numpy(), df_wide["extra0"].to_numpy())
+
+
+def test_subset(df_wide: pd.DataFrame):
+    validator = DataFrameValidator()
+    df_subset = validator.validate(schema, df_wide, subset=["column1", "extra0"])
+
+    assert df_subset["quality_issues"].to_list() == ["Column <column1>: less_than_or_equal_to(10)"] + ["None"] * 4
+    assert validator.report(schema, df_wide, subset=["column3"]).invalid_rows == 1
+    pd.testing.assert_frame_equal(df_subset[df_wide.columns], df_wide)
+
+
+def test_subset_missing_column(df_wide: pd.DataFrame):
+    df = df_wide.drop(columns="column2")
+
+    is_valid, df_subset = DataFrameValidator().validate(schema, df, validity_flag=True, subset=["column2"])
+
+    assert not is_valid
+    assert df_subset["quality_status"].to_list() == ["Invalid"] * 5
+
+
+def test_subset_coerce(df_wide: pd.DataFrame):
+    coerce_schema = pa.DataFrameSchema({"column1": pa.Column(float, coerce=True), "extra0": pa.Column(float)})
+
+    df_report = DataFrameValidator().validate(coerce_schema, df_wide, subset=["column1"])
+    df_raw = DataFrameValidator(quality_report=False).validate(coerce_schema, df_wide, subset=["column1"])
+
+    assert df_report["column1"].dtype == df_raw["column1"].dtype == np.float64
+    assert df_report["extra0"].dtype == df_raw["extra0"].dtype == np.int64
+    assert "quality_issues" not in df_raw
+
+
+def test_infer_columns(df_wide: pd.DataFrame):
+    regex_schema = pa.DataFrameSchema({"extra[0-2]": pa.Column(int, regex=True), "column1": pa.Column(int)})
+
+    assert infer_columns(schema, df_wide) == ["column1", "column2", "column3"]
+    assert infer_columns(regex_schema, df_wide) == ["extra0", "extra1", "extra2", "column1"]
+    assert infer_columns(pa.DataFrameSchema(schema.columns, strict=True), df_wide) is None
+    assert infer_columns(schema, df_wide[["column1", "column2", "column3"]]) is None
+
+
+def test_project_schema():
+    unique_schema = pa.DataFrameSchema(
+        schema.columns, checks=pa.Check(lambda df: df.shape[0] > 0), unique=["column1", "column2"]
+    )
+
+    projected = project_schema(unique_schema, ["column1", "column2"])
+    assert list(projected.columns) == ["column1", "column2"]
+    assert projected.unique == ["column1", "column2"]
+    assert not projected.checks
+    assert project_schema(unique_schema, ["column1"]).unique is None
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from pandera_report.parser import DefaultFailureCaseParser
+from pandera_report.report import QualityReport
+from pandera_report.validator import DataFrameValidator
+
+schema = pa.DataFrameSchema(
+    {
+        "column1": pa.Column(int, checks=pa.Check.le(10)),
+        "column2": pa.Column(float, checks=pa.Check.lt(-1.2)),
+        "column3": pa.Column(str, checks=pa.Check.str_startswith("value_")),
+    }
+)
+
+
+class UpperCaseParser(DefaultFailureCaseParser):
+    def create_failure_case(self, column: str, check: str) -> str:
+        return f"{column}={check}".upper()
+
+
+class CountingParser(DefaultFailureCaseParser):
+    def create_quality_issues(self, df: pd.DataFrame) -> str:
+        return f"{len(df)} issue(s) in {', '.join(df['column'])}"
+
+
+class DuckTypedParser:
+    valid_status = "Valid"
+    invalid_status = "Invalid"
+    none_status = "None"
+
+    def parse_failure_cases(self, df: pd.DataFrame, number_of_rows: int) -> tuple[pd.Series, pd.Series]:
+        series_issues = df.groupby("reference")["column"].agg(",".join).reindex(range(number_of_rows))
+        series_status = series_issues.notna().map({True: self.invalid_status, False: self.valid_status})
+        return series_issues.fillna(self.none_status), series_status
+
+    def create_quality_status_series(self, series_issues: pd.Series) -> pd.Series:
+        return pd.Series(np.where(series_issues == self.none_status, self.valid_status, self.invalid_status))
+
+
+def test_quality_report_duck_typed_parser(df_invalid_values):
+    df = DataFrameValidator(parser=DuckTypedParser()).validate(schema, df_invalid_values)
+
+    assert df["quality_issues"].to_list() == ["column1", "None", "None", "None", "column3"]
+    assert df["quality_status"].to_list() == ["Invalid", "Valid", "Valid", "Valid", "Invalid"]
+
+
+@pytest.mark.parametrize("parser", [None, UpperCaseParser(), CountingParser()])
+@pytest.mark.parametrize("df_fixture", ["df_valid", "df_invalid_values", "df_invalid_column", "df_empty"])
+def test_quality_report_to_frame(parser, df_fixture: str, request):
+    df = request.getfixturevalue(df_fixture)
+    validator = DataFrameValidator(parser=parser)
+
+    report = validator.report(schema, df)
+
+    pd.testing.assert_frame_equal(report.to_frame(), validator.validate(schema, df))
+
+
+@pytest.mark.parametrize("parser", [None, UpperCaseParser(), CountingParser()])
+def test_quality_report_rows(parser, df_invalid_column):
+    validator = DataFrameValidator(parser=parser)
+    expected = validator.validate(schema, df_invalid_column)["quality_issues"]
+
+    report = validator.report(schema, df_invalid_column)
+
+    assert report[0] == expected[0]
+    assert report[-1] == expected[4]
+    assert report[1:3].to_list() == expected[1:3].to_list()
+    assert report[::-2].to_list() == expected[::-2].to_list()
+    assert report.formatted_issues is None
+    assert report.issues().to_list() == expected.to_list()
+    assert report.formatted_issues is not None
+
+
+def test_quality_report_status(df_invalid_values):
+    report = DataFrameValidator().report(schema, df_invalid_values)
+
+    assert not report.is_valid
+    assert report.invalid_rows == 2
+    assert report.status().to_list() == ["Invalid", "Valid", "Valid", "Valid", "Invalid"]
+    assert report.formatted_issues is None
+    assert report.to_failure_cases().to_dict("list") == {
+        "reference": [0, 4],
+        "column": ["column1", "column3"],
+        "check": ["less_than_or_equal_to(10)", "str_startswith('value_')"],
+    }
+
+
+def test_quality_report_without_failures(df_valid):
+    report = QualityReport(df_valid, True)
+
+    assert len(report) == 5
+    assert report.invalid_rows == 0
+    assert (report.to_series() == "None").all()
+    assert (report.status() == "Valid").all()
+
+
+def test_quality_report_invalid_references(df_valid):
+    with pytest.raises(ValueError):
+        QualityReport(df_valid, False, np.array([5]), np.array([0]), pd.DataFrame({"column": ["a"], "check": ["b"]}))
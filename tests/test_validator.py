@@ -12,6 +12,7 @@ import pytest
 from pandera.errors import SchemaError, SchemaErrors
 from pandera.typing import Series
 
+from pandera_report.engine import NativeCheckEngine
 from pandera_report.options import QUALITY_COLUMNS_OPTIONS, QualityColumnsOptions
 from pandera_report.parser import FailureCaseParserProtocol
 from pandera_report.validator import DataFrameValidator
@@ -146,3 +147,51 @@ def test_validator_columns(columns: Optional[QualityColumnsOptions], expected: Q
     validator = DataFrameValidator(columns=columns)
 
     assert validator.columns == expected
+
+
+@pytest.mark.parametrize("index", [[10, 20, 30], [2, 1, 0], ["c", "a", "b"]])
+def test_validator_index_labels(index: list):
+    df = pd.DataFrame({"a": [1, 4, 6]}, index=index)
+    schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.le(3))})
+
+    is_valid, df_validated = DataFrameValidator().validate(schema, df, validity_flag=True)
+
+    assert not is_valid
+    assert df_validated.index.to_list() == index
+    assert df_validated["quality_status"].to_list() == ["Valid", "Invalid", "Invalid"]
+
+
+@pytest.mark.parametrize("engine", [None, NativeCheckEngine()])
+@pytest.mark.parametrize(
+    "index, expected",
+    [
+        ([10, 11, 12], ["Invalid", "Invalid", "Valid"]),
+        ([2, 0, 1], ["Invalid", "Invalid", "Invalid"]),
+        ([12, 12, 0], ["Valid", "Valid", "Invalid"]),
+    ],
+)
+def test_validator_index_check(engine: Optional[NativeCheckEngine], index: list, expected: list):
+    df = pd.DataFrame({"a": [1, 1, 1]}, index=index)
+    schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.le(3))}, index=pa.Index(int, pa.Check.ge(12)))
+
+    df_validated = DataFrameValidator(engine=engine).validate(schema, df)
+
+    assert df_validated.index.to_list() == index
+    assert df_validated["quality_status"].to_list() == expected
+
+
+@pytest.mark.parametrize("engine", [None, NativeCheckEngine()])
+def test_validator_duplicated_index(engine: Optional[NativeCheckEngine]):
+    df = pd.DataFrame({"a": ["x_1", "y", "x_2", "x_2", "z"]}, index=[1, 1, 2, 2, 3])
+    schema = pa.DataFrameSchema({"a": pa.Column(str, pa.Check.str_startswith("x"), unique=True)})
+
+    df_validated = DataFrameValidator(engine=engine).validate(schema, df)
+
+    assert df_validated.index.to_list() == [1, 1, 2, 2, 3]
+    assert df_validated["quality_issues"].to_list() == [
+        "None",
+        "Column <a>: str_startswith('x')",
+        "Column <a>: field_uniqueness",
+        "Column <a>: field_uniqueness",
+        "Column <a>: str_startswith('x')",
+    ]